@@ -7,7 +7,15 @@ Modified to include URL extraction, CSV output format, and comprehensive summari
 
 import os
 import re
+import mmap
+import bisect
 import json
+import contextlib
+import io
+from collections import defaultdict
+from itertools import accumulate, islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 from datetime import datetime, timezone
@@ -19,40 +27,342 @@ try:
 except ImportError:
     TIKTOKEN_AVAILABLE = False
 
+# Use orjson for writing JSON output files when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Text cleaning patterns: HTML tags and runs of unwanted characters are removed in
+# one pass ('<' is matched on its own so it can still open a tag), then whitespace
+# is collapsed in a second pass
+_CLEAN_RE = re.compile(r'<[^>]+>|[^\w\s\-/.:,;()<]+|<')
+_WS_RE = re.compile(r'\s+')
+
+# Source URL written near the top of each scrap file, looked for in its first lines
+_URL_RE = re.compile(rb'https?://[^\s<>"\']+')
+_URL_HEADER_LINES = 11
+
+# Fixed prompt text around the per-file date sections; the sections are joined
+# in between with newlines, so each prompt is assembled with a single join
+_SIMPLE_PROMPT_HEADER = """Analyze the text below and identify business-critical dates. Look for dates related to:
+
+1. End of Life (EOL) - Product manufacturing stops
+2. End of Sales (EOS) - Last purchase date
+3. End of Service/Support - Support ends
+4. End of Security Updates - Security patches stop
+5. Last Order Date - Final ordering deadline
+6. Retirement/Discontinuation - Product retirement
+7. Migration Deadline - Must migrate by this date
+8. Contract/License Expiration - Agreements expire
+9. Other Business Critical Dates
+
+TEXT TO ANALYZE:"""
+
+_SIMPLE_PROMPT_FOOTER = """
+For each business-relevant date found, provide:
+- Product/service name (if mentioned)
+- Exact date
+- Category (from list above)
+- Context quote
+- URL (from the source file)
+- Confidence (High/Medium/Low)
+
+Ignore: publication dates, random timestamps, non-business dates
+
+RESPOND IN CSV FORMAT:
+"product","date","category","context","url","confidence"
+
+Provide only the CSV data rows, no headers or additional text."""
+
+_PIPELINE_PROMPT_HEADER = """You are analyzing text from web scraping to identify business-critical dates. Below are text snippets containing various dates. Your task is to identify and categorize dates that relate to product lifecycle, support, or business operations.
+
+TEXT TO ANALYZE:"""
+
+_PIPELINE_PROMPT_FOOTER = """
+TASK: Analyze each date found and determine if it relates to any of these categories:
+1. End of Life (EOL) - When product stops being manufactured
+2. End of Sales (EOS) - Last date for purchasing  
+3. End of Service/Support - When support/service ends
+4. End of Security Updates - When security patches stop
+5. Last Order Date - Final date to place orders
+6. Retirement/Discontinuation Date - When product is retired
+7. Migration Deadline - When users must migrate to new solution
+8. Contract Expiration - When agreements/licenses expire
+9. Other Business Critical Dates - Any other important business dates
+
+For each relevant date you identify, provide:
+- Product/service name if mentioned
+- The exact date
+- Category (from list above)
+- Source context (brief quote showing how date was mentioned)
+- URL (from the source file)
+- Confidence level (High/Medium/Low)
+
+IMPORTANT: 
+- Only include dates that appear to be business/product related
+- Ignore random dates, publication dates, or irrelevant timestamps
+- If a date's purpose is unclear, mark confidence as "Low"
+- If no relevant dates are found, respond with a single row: "No business-critical dates identified","","","","",""
+
+RESPOND IN CSV FORMAT:
+"product","date","category","context","url","confidence"
+
+Provide only the CSV data rows, no headers or additional text."""
+
+
+# Comprehensive date patterns
+_DATE_PATTERNS = (
+    r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',  # MM/DD/YYYY
+    r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',    # YYYY/MM/DD
+    r'\b\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+\d{2,4}\b',
+    r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+\d{1,2},?\s+\d{2,4}\b',
+    r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+\d{2,4}\b',
+    r'\bQ[1-4]\s+\d{4}\b',  # Q1 2024
+    r'\b(FY|CY)\s*\d{2,4}\b',  # FY2024
+    r'\b20\d{2}\b',  # Years 2000-2099
+    r'\b\d{4}-\d{2}-\d{2}T?\d{0,2}:?\d{0,2}:?\d{0,2}\b',  # ISO dates
+    r'\b(early|mid|late)\s+(20\d{2})\b',
+    r'\b(spring|summer|fall|winter|autumn)\s+(20\d{2})\b',
+    r'\b(end\s+of|by\s+end\s+of)\s+\w+\s+\d{4}\b'
+)
+
+# Hyperscan is deliberately not used here: it reports every (pattern, end) pair
+# rather than re's leftmost-first matches, and it has no group capture, so
+# reproducing the per-pattern priority and 10-character dedup in _scan_dates
+# would need a Python-level pass over all raw events.
+# Compiled once per process and shared by every extractor instance; they are
+# still applied one at a time in list order, since that order decides which of
+# two nearby matches is kept
+_DATE_REGEXES = tuple(re.compile(p, re.IGNORECASE) for p in _DATE_PATTERNS)
+
+
+# Threads used to write prompt/metadata files concurrently (file writes release the GIL)
+_WRITER_THREADS = 8
+
+
+def _write_text(path: Path, text: str) -> None:
+    """Write text to path as UTF-8"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _write_json(path: Path, data) -> None:
+    """Write data to path as UTF-8 JSON indented by two spaces"""
+    if ORJSON_AVAILABLE:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        # json.dump issues one write per encoded fragment; encode once, write once
+        Path(path).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+
+
+def _count_word_offsets(codepoints, offsets) -> int:
+    """Fill offsets with each word's offset as computed by build_word_index
+    
+    Works over UTF-32 code points and returns the number of words; compiled
+    with Numba by _load_word_offsets_jit.
+    """
+    n = 0
+    char_pos = 0
+    in_word = False
+    for c in codepoints:
+        # Same whitespace set as str.split()
+        is_space = (c == 32 or 9 <= c <= 13 or 28 <= c <= 31 or c == 133 or c == 160
+                    or c == 5760 or 8192 <= c <= 8202 or c == 8232 or c == 8233
+                    or c == 8239 or c == 8287 or c == 12288)
+        if is_space:
+            if in_word:
+                char_pos += 1
+                in_word = False
+        else:
+            if not in_word:
+                offsets[n] = char_pos
+                n += 1
+                in_word = True
+            char_pos += 1
+    return n
+
+
+# (numpy, compiled _count_word_offsets) once loaded; False when numba is not installed
+_word_offsets_jit = None
+
+
+def _load_word_offsets_jit():
+    """Import numpy and numba and compile the word offset scan on first use"""
+    # Not at module import: numba takes long to import and the GUI imports this module
+    global _word_offsets_jit
+    if _word_offsets_jit is None:
+        try:
+            import numpy
+            from numba import njit
+        except ImportError:
+            _word_offsets_jit = False
+        else:
+            _word_offsets_jit = (numpy, njit(cache=True)(_count_word_offsets))
+    return _word_offsets_jit
+
+
+def _word_at(offsets, start: int) -> int:
+    """Index of the first word starting at or after start"""
+    if isinstance(offsets, list):
+        return bisect.bisect_left(offsets, start)
+    # ndarray from the Numba path: bisect would box every probed element
+    return int(offsets.searchsorted(start))
+
+
+class _RecordItemAccess:
+    """Read access by the dict keys these records replaced (record['date'])"""
+    __slots__ = ()
+    _KEY_ALIASES: Dict[str, str] = {}
+    
+    def __getitem__(self, key: str):
+        name = self._KEY_ALIASES.get(key, key)
+        if name not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, name)
+    
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+# __slots__ is declared by hand (dataclass(slots=True) needs Python 3.10), so
+# the fields have no class-level defaults and __init__ is written out instead
+@dataclass(init=False)
+class DateMatch(_RecordItemAccess):
+    """A date found in a scrap file (or one of its chunks)"""
+    __slots__ = ('filename', 'date', 'context', 'position', 'url', 'pattern_used')
+    # find_dates used to return the date under 'date', find_dates_in_text under 'date_found'
+    _KEY_ALIASES = {'date_found': 'date'}
+    
+    filename: str
+    date: str
+    context: str
+    position: int
+    url: str
+    pattern_used: Optional[str]
+    
+    def __init__(self, filename: str, date: str, context: str, position: int, url: str,
+                 pattern_used: Optional[str] = None):
+        self.filename = filename
+        self.date = date
+        self.context = context
+        self.position = position
+        self.url = url
+        self.pattern_used = pattern_used
+    
+    def to_metadata(self) -> Dict:
+        """Dict layout written to the pipeline's batch metadata files"""
+        return {
+            'filename': self.filename,
+            'date_found': self.date,
+            'context': self.context,
+            'position': self.position,
+            'pattern_used': self.pattern_used,
+            'url': self.url
+        }
+
+
+@dataclass(init=False)
+class FileSummary(_RecordItemAccess):
+    """Per-file processing data collected for the comprehensive summary"""
+    __slots__ = ('scrap_file_name', 'scrap_file_path', 'url', 'dates_found', 'has_dates',
+                 'prompt_files', 'error')
+    
+    scrap_file_name: str
+    scrap_file_path: str
+    url: str
+    dates_found: int
+    has_dates: bool
+    prompt_files: List[Dict]
+    error: Optional[str]
+    
+    def __init__(self, scrap_file_name: str, scrap_file_path: str, url: str, dates_found: int,
+                 has_dates: bool, prompt_files: Optional[List[Dict]] = None,
+                 error: Optional[str] = None):
+        self.scrap_file_name = scrap_file_name
+        self.scrap_file_path = scrap_file_path
+        self.url = url
+        self.dates_found = dates_found
+        self.has_dates = has_dates
+        self.prompt_files = [] if prompt_files is None else prompt_files
+        self.error = error
+
+
+# cl100k_base encoder shared by every extractor in the process
+_tokenizer = None
+
+
+def _get_tokenizer():
+    """Load the tiktoken encoder on first use and reuse it afterwards"""
+    global _tokenizer
+    if _tokenizer is None:
+        _tokenizer = tiktoken.get_encoding("cl100k_base")
+    return _tokenizer
+
+
+# A file is scanned at roughly 1-2 MB/s, so below this total size the pool's
+# start-up (with spawn, every worker re-imports the module) costs more than it saves
+_POOL_MIN_BYTES = 4 * 1024 * 1024
+
+# Extractor instance owned by each worker process of the file-scanning pool
+_worker_extractor = None
+
+
+def _init_worker(extractor_cls, max_tokens: int) -> None:
+    """Build the worker's own extractor (and tokenizer) once per process"""
+    global _worker_extractor
+    # The parent has already printed any missing-tiktoken warning
+    with contextlib.redirect_stdout(io.StringIO()):
+        _worker_extractor = extractor_cls(max_tokens=max_tokens)
+
+
+def _total_size(file_paths: List[Path]) -> int:
+    """Combined size of the files in bytes (unreadable files count as empty)"""
+    total = 0
+    for file_path in file_paths:
+        try:
+            total += file_path.stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+def _scan_file_in_worker(filepath: Path):
+    """Scan a single file with the worker's extractor"""
+    return _worker_extractor.scan_file(filepath)
+
 
 class DateExtractorBase:
     """Base class for date extraction functionality"""
     
-    def __init__(self, max_tokens: int = 3500, output_prefix: str = "date_extraction_output"):
+    def __init__(self, max_tokens: int = 3500, output_prefix: str = "date_extraction_output",
+                 max_workers: Optional[int] = None):
         self.max_tokens = max_tokens
         self.output_prefix = output_prefix
-        self.timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        self.max_workers = max_workers  # None = one worker process per CPU
+        session_start = datetime.now(timezone.utc)
+        self.timestamp = session_start.strftime("%Y%m%d_%H%M%S")
+        self.timestamp_iso = session_start.isoformat()
+        self._cwd = Path.cwd()  # Cached to avoid a getcwd() call per absolute path
         self.output_dir = Path(f"{output_prefix}_{self.timestamp}")
         
         # Initialize tokenizer
         if TIKTOKEN_AVAILABLE:
-            self.tokenizer = tiktoken.get_encoding("cl100k_base")
-            self.count_tokens = lambda text: len(self.tokenizer.encode(text))
+            self.tokenizer = _get_tokenizer()
+            # Scraped text is plain text: skip the special-token checks of encode()
+            self.count_tokens = lambda text: len(self.tokenizer.encode_ordinary(text))
         else:
             print("⚠️  tiktoken not installed - using approximate token counting")
             print("   Install with: pip install tiktoken")
             self.count_tokens = self._count_tokens_fallback
         
-        # Comprehensive date patterns
-        self.date_patterns = [
-            r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',  # MM/DD/YYYY
-            r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',    # YYYY/MM/DD
-            r'\b\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+\d{2,4}\b',
-            r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+\d{1,2},?\s+\d{2,4}\b',
-            r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+\d{2,4}\b',
-            r'\bQ[1-4]\s+\d{4}\b',  # Q1 2024
-            r'\b(FY|CY)\s*\d{2,4}\b',  # FY2024
-            r'\b20\d{2}\b',  # Years 2000-2099
-            r'\b\d{4}-\d{2}-\d{2}T?\d{0,2}:?\d{0,2}:?\d{0,2}\b',  # ISO dates
-            r'\b(early|mid|late)\s+(20\d{2})\b',
-            r'\b(spring|summer|fall|winter|autumn)\s+(20\d{2})\b',
-            r'\b(end\s+of|by\s+end\s+of)\s+\w+\s+\d{4}\b'
-        ]
+        # Date patterns and their compiled regexes are module-level constants
+        self.date_patterns = list(_DATE_PATTERNS)
+        self._compiled_patterns = _DATE_REGEXES
         
         self.results = []
         self.no_dates_files = []
@@ -62,69 +372,140 @@ class DateExtractorBase:
         """Fallback token counter when tiktoken is not available"""
         return len(text) // 4
     
+    def count_tokens_many(self, texts: List[str]) -> List[int]:
+        """Count tokens for many texts at once (one batched tiktoken call)"""
+        if TIKTOKEN_AVAILABLE:
+            encoded = self.tokenizer.encode_ordinary_batch(texts, num_threads=os.cpu_count() or 1)
+            return [len(tokens) for tokens in encoded]
+        return [self._count_tokens_fallback(text) for text in texts]
+    
+    def absolute_path(self, path: Path) -> str:
+        """Absolute path string, resolved against the cwd cached at construction"""
+        return str(path if path.is_absolute() else self._cwd / path)
+    
     def extract_url_from_file(self, filepath: Path) -> Optional[str]:
         """Extract URL from scrap file - typically found at the beginning"""
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                # Read first few lines to look for URL
-                for i, line in enumerate(f):
-                    if i > 10:  # Only check first 10 lines
-                        break
-                    # Look for URL patterns
-                    url_match = re.search(r'https?://[^\s<>"\']+', line)
-                    if url_match:
-                        return url_match.group(0)
-                    # Also check for common URL indicators
-                    if 'URL:' in line or 'Source:' in line:
-                        url_match = re.search(r'https?://[^\s<>"\']+', line)
-                        if url_match:
-                            return url_match.group(0)
-            return None
+            with open(filepath, 'rb') as f:
+                # Only the header lines of the file are checked for a URL
+                return self._search_url(b''.join(islice(f, _URL_HEADER_LINES)))
         except Exception as e:
             print(f"Error extracting URL from {filepath}: {e}")
             return None
     
+    def _search_url(self, buffer) -> Optional[str]:
+        """Find the first URL within the header lines of a bytes-like buffer"""
+        # The header ends after the _URL_HEADER_LINES-th newline, however long the
+        # lines are; endpos bounds the search without copying a slice of the buffer
+        header_end = -1
+        for _ in range(_URL_HEADER_LINES):
+            header_end = buffer.find(b'\n', header_end + 1)
+            if header_end == -1:
+                header_end = len(buffer)
+                break
+        url_match = _URL_RE.search(buffer, 0, header_end)
+        if url_match:
+            return url_match.group(0).decode('utf-8', errors='ignore')
+        return None
+    
+    def read_scrap_file(self, filepath: Path) -> Tuple[Optional[str], str]:
+        """Memory-map a scrap file once and return its URL and decoded content"""
+        # A raw descriptor is enough for mmap - no buffered file object is needed
+        fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            # mmap cannot map an empty file
+            if os.fstat(fd).st_size == 0:
+                return None, ""
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                # Decode straight from the mapping, no intermediate bytes copy
+                url, content = self._search_url(mm), str(mm, 'utf-8', 'ignore')
+        finally:
+            os.close(fd)
+        
+        # Translate newlines as text-mode reading does (scrap files written on
+        # Windows end their lines with \r\n)
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return url, content
+    
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
-        text = re.sub(r'<[^>]+>', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^\w\s\-/.:,;()]+', ' ', text)
-        return text.strip()
+        return _WS_RE.sub(' ', _CLEAN_RE.sub(' ', text)).strip()
     
-    def extract_context(self, text: str, start: int, end: int, words: int = 100) -> str:
-        """Extract context around found date"""
+    def build_word_index(self, text: str) -> Tuple[List[str], List[int]]:
+        """Split text into words and record the character offset of each word"""
         text_words = text.split()
+        word_offsets_jit = _load_word_offsets_jit()
+        if word_offsets_jit:
+            np, count_word_offsets = word_offsets_jit
+            codepoints = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+            offsets = np.empty(len(codepoints), np.int64)
+            return text_words, offsets[:count_word_offsets(codepoints, offsets)]
+        
+        offsets = []
         char_pos = 0
-        word_start = 0
-        for i, word in enumerate(text_words):
-            if char_pos >= start:
-                word_start = max(0, i - words)
-                word_end = min(len(text_words), i + words)
-                return ' '.join(text_words[word_start:word_end])
+        for word in text_words:
+            offsets.append(char_pos)
             char_pos += len(word) + 1
+        return text_words, offsets
+    
+    def extract_context(self, text: str, start: int, end: int, words: int = 100,
+                        word_index: Optional[Tuple[List[str], List[int]]] = None) -> str:
+        """Extract context around found date
+        
+        Callers matching many dates in the same cleaned (single-spaced) text pass
+        its prebuilt word index; the context is then cut from the text as a single
+        slice instead of joining a list of words for every match.
+        """
+        if word_index is None:
+            text_words, offsets = self.build_word_index(text)
+            i = _word_at(offsets, start)
+            if i < len(text_words):
+                return ' '.join(text_words[max(0, i - words):i + words])
+            return text[:500]  # Fallback
+        
+        text_words, offsets = word_index
+        i = _word_at(offsets, start)
+        if i < len(text_words):
+            word_start = max(0, i - words)
+            word_end = min(len(text_words), i + words) - 1
+            return text[offsets[word_start]:offsets[word_end] + len(text_words[word_end])]
         return text[:500]  # Fallback
     
-    def find_dates(self, text: str, filename: str, url: Optional[str] = None) -> List[Dict]:
+    def _scan_dates(self, clean_text: str):
+        """Yield (pattern, match) for every date kept in cleaned text
+        
+        Patterns are tried in priority order and a match is dropped when an
+        already accepted one starts within 10 characters of it. The accepted
+        start positions are kept sorted so that check is a single bisect.
+        """
+        accepted = []
+        for pattern, regex in zip(self.date_patterns, self._compiled_patterns):
+            for match in regex.finditer(clean_text):
+                start = match.start()
+                i = bisect.bisect_left(accepted, start - 9)
+                if i < len(accepted) and accepted[i] < start + 10:
+                    continue
+                accepted.insert(i, start)
+                yield pattern, match
+    
+    def find_dates(self, text: str, filename: str, url: Optional[str] = None) -> List[DateMatch]:
         """Find all dates in text"""
         dates_found = []
-        found_positions = set()
         clean_text = self.clean_text(text)
+        word_index = self.build_word_index(clean_text)
         
-        for pattern in self.date_patterns:
-            for match in re.finditer(pattern, clean_text, re.IGNORECASE):
-                if any(abs(match.start() - pos) < 10 for pos in found_positions):
-                    continue
-                
-                found_positions.add(match.start())
-                context = self.extract_context(clean_text, match.start(), match.end())
-                
-                dates_found.append({
-                    'filename': filename,
-                    'date': match.group(0),
-                    'context': context,
-                    'position': match.start(),
-                    'url': url or 'Not available'
-                })
+        for _, match in self._scan_dates(clean_text):
+            context = self.extract_context(clean_text, match.start(), match.end(),
+                                           word_index=word_index)
+            
+            dates_found.append(DateMatch(
+                filename=filename,
+                date=match.group(0),
+                context=context,
+                position=match.start(),
+                url=url or 'Not available'
+            ))
         
         return dates_found
     
@@ -132,73 +513,70 @@ class DateExtractorBase:
         """Create output directory"""
         self.output_dir.mkdir(exist_ok=True)
     
-    def find_scrap_files(self, directory: Optional[Path] = None) -> List[Path]:
+    @staticmethod
+    def find_scrap_files(directory: Optional[Path] = None) -> List[Path]:
         """Find all files starting with 'Scrap_' and ending with '.txt'"""
         search_dir = directory or Path(".")
-        return list(search_dir.glob("Scrap_*.txt"))
+        # One scandir pass with plain string tests instead of Path.glob's pattern
+        # machinery; normcase keeps glob's case-insensitivity on Windows, and
+        # DirEntry.is_file() uses the cached entry type, not a stat call
+        prefix, suffix = os.path.normcase("Scrap_"), os.path.normcase(".txt")
+        try:
+            with os.scandir(search_dir) as entries:
+                return [search_dir / entry.name for entry in entries
+                        if os.path.normcase(entry.name).startswith(prefix)
+                        and os.path.normcase(entry.name).endswith(suffix)
+                        and entry.is_file()]
+        except OSError:
+            # Like Path.glob, a missing or unreadable directory has no matches
+            return []
+    
+    def scan_file(self, filepath: Path):
+        """Scan a single file without modifying extractor state (implemented by subclasses)"""
+        raise NotImplementedError
+    
+    def scan_files(self, file_paths: List[Path]) -> List:
+        """Run scan_file over all files, in worker processes when there is enough text"""
+        if (self.max_workers == 1 or len(file_paths) < 2
+                or _total_size(file_paths) < _POOL_MIN_BYTES):
+            return [self.scan_file(file_path) for file_path in file_paths]
+        
+        # About four chunks per worker amortizes IPC while still balancing uneven file sizes
+        workers = self.max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(file_paths) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 initializer=_init_worker,
+                                 initargs=(type(self), self.max_tokens)) as executor:
+            return list(executor.map(_scan_file_in_worker, file_paths, chunksize=chunksize))
 
 
 class SimpleDateExtractor(DateExtractorBase):
     """Simple date extractor implementation (based on run_date_extraction.py)"""
     
-    def __init__(self, max_tokens: int = 3000):
-        super().__init__(max_tokens, "date_extraction_output")
+    def __init__(self, max_tokens: int = 3000, max_workers: Optional[int] = None):
+        super().__init__(max_tokens, "date_extraction_output", max_workers)
     
-    def create_prompt(self, dates: List[Dict]) -> str:
+    def create_prompt(self, dates: List[DateMatch]) -> str:
         """Create LLM prompt with URL information and CSV output format"""
         # Group by file
-        by_file = {}
+        by_file = defaultdict(list)
         for d in dates:
-            if d['filename'] not in by_file:
-                by_file[d['filename']] = []
-            by_file[d['filename']].append(d)
+            by_file[d.filename].append(d)
         
         # Build context with URL information
-        sections = []
+        sections = [_SIMPLE_PROMPT_HEADER]
+        append = sections.append
         for filename, file_dates in by_file.items():
             # Get URL from first date entry (all dates from same file have same URL)
-            file_url = file_dates[0]['url'] if file_dates else 'Not available'
-            sections.append(f"=== FILE: {filename} ===")
-            sections.append(f"URL: {file_url}")
-            sections.append("")
+            file_url = file_dates[0].url if file_dates else 'Not available'
+            append(f"=== FILE: {filename} ===\nURL: {file_url}\n")
             for date_info in file_dates:
-                sections.append(f"Date: {date_info['date']}")
-                sections.append(f"Context: {date_info['context']}")
-                sections.append("---")
-        
-        context_text = "\n".join(sections)
+                append(f"Date: {date_info.date}\nContext: {date_info.context}\n---")
+        append(_SIMPLE_PROMPT_FOOTER)
         
-        return f"""Analyze the text below and identify business-critical dates. Look for dates related to:
-
-1. End of Life (EOL) - Product manufacturing stops
-2. End of Sales (EOS) - Last purchase date
-3. End of Service/Support - Support ends
-4. End of Security Updates - Security patches stop
-5. Last Order Date - Final ordering deadline
-6. Retirement/Discontinuation - Product retirement
-7. Migration Deadline - Must migrate by this date
-8. Contract/License Expiration - Agreements expire
-9. Other Business Critical Dates
-
-TEXT TO ANALYZE:
-{context_text}
-
-For each business-relevant date found, provide:
-- Product/service name (if mentioned)
-- Exact date
-- Category (from list above)
-- Context quote
-- URL (from the source file)
-- Confidence (High/Medium/Low)
-
-Ignore: publication dates, random timestamps, non-business dates
-
-RESPOND IN CSV FORMAT:
-"product","date","category","context","url","confidence"
-
-Provide only the CSV data rows, no headers or additional text."""
+        return "\n".join(sections)
     
-    def process_files(self, file_paths: Optional[List[Path]] = None) -> Tuple[List[Dict], List[str]]:
+    def process_files(self, file_paths: Optional[List[Path]] = None) -> Tuple[List[DateMatch], List[str]]:
         """Process files and extract dates with URL information"""
         if file_paths is None:
             file_paths = self.find_scrap_files()
@@ -206,58 +584,52 @@ Provide only the CSV data rows, no headers or additional text."""
         all_dates = []
         no_date_files = []
         
-        for file_path in file_paths:
-            try:
-                # Extract URL from file
-                url = self.extract_url_from_file(file_path)
-                
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                dates = self.find_dates(content, file_path.name, url)
-                if dates:
-                    all_dates.extend(dates)
-                    # Store summary data
-                    self.file_summary_data.append({
-                        'scrap_file_name': file_path.name,
-                        'scrap_file_path': str(file_path.absolute()),
-                        'url': url or 'Not available',
-                        'dates_found': len(dates),
-                        'has_dates': True
-                    })
-                else:
-                    no_date_files.append(file_path.name)
-                    self.file_summary_data.append({
-                        'scrap_file_name': file_path.name,
-                        'scrap_file_path': str(file_path.absolute()),
-                        'url': url or 'Not available',
-                        'dates_found': 0,
-                        'has_dates': False
-                    })
-            
-            except Exception as e:
-                print(f"Error processing {file_path.name}: {e}")
-                no_date_files.append(file_path.name)
-                self.file_summary_data.append({
-                    'scrap_file_name': file_path.name,
-                    'scrap_file_path': str(file_path.absolute()),
-                    'url': 'Error extracting',
-                    'dates_found': 0,
-                    'has_dates': False,
-                    'error': str(e)
-                })
+        for dates, summary in self.scan_files(file_paths):
+            all_dates.extend(dates)
+            self.file_summary_data.append(summary)
+            if not dates:
+                no_date_files.append(summary.scrap_file_name)
         
         return all_dates, no_date_files
     
-    def create_batches(self, dates: List[Dict]) -> List[List[Dict]]:
+    def scan_file(self, file_path: Path) -> Tuple[List[DateMatch], FileSummary]:
+        """Extract dates and summary data from a single file"""
+        # Name and absolute path are derived once and shared by every record of the file
+        file_name = file_path.name
+        file_path_str = self.absolute_path(file_path)
+        try:
+            # Extract URL and content from file
+            url, content = self.read_scrap_file(file_path)
+            
+            dates = self.find_dates(content, file_name, url)
+            return dates, FileSummary(
+                scrap_file_name=file_name,
+                scrap_file_path=file_path_str,
+                url=url or 'Not available',
+                dates_found=len(dates),
+                has_dates=bool(dates)
+            )
+        
+        except Exception as e:
+            print(f"Error processing {file_name}: {e}")
+            return [], FileSummary(
+                scrap_file_name=file_name,
+                scrap_file_path=file_path_str,
+                url='Error extracting',
+                dates_found=0,
+                has_dates=False,
+                error=str(e)
+            )
+    
+    def create_batches(self, dates: List[DateMatch]) -> List[List[DateMatch]]:
         """Create batches from dates"""
         batches = []
         current_batch = []
         current_tokens = 0
         
-        for date_info in dates:
-            tokens = self.count_tokens(date_info['context'])
-            
+        token_counts = self.count_tokens_many([d.context for d in dates])
+        
+        for date_info, tokens in zip(dates, token_counts):
             if current_tokens + tokens > self.max_tokens and current_batch:
                 batches.append(current_batch)
                 current_batch = [date_info]
@@ -271,32 +643,35 @@ Provide only the CSV data rows, no headers or additional text."""
         
         return batches
     
-    def generate_prompt_files(self, batches: List[List[Dict]]) -> List[str]:
+    def generate_prompt_files(self, batches: List[List[DateMatch]]) -> List[str]:
         """Generate prompt files from batches"""
         self.create_output_directory()
         prompt_files = []
         
-        for i, batch in enumerate(batches):
-            prompt = self.create_prompt(batch)
-            filename = f"prompt_{self.timestamp}_batch_{i+1}.txt"
-            filepath = self.output_dir / filename
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(prompt)
-            
-            prompt_files.append(filename)
-            
-            # Update summary data with prompt file information
-            batch_files = set(d['filename'] for d in batch)
-            for summary_item in self.file_summary_data:
-                if summary_item['scrap_file_name'] in batch_files:
-                    if 'prompt_files' not in summary_item:
-                        summary_item['prompt_files'] = []
-                    summary_item['prompt_files'].append({
-                        'prompt_file_name': filename,
-                        'prompt_file_path': str(filepath.absolute()),
-                        'batch_number': i + 1
-                    })
+        with ThreadPoolExecutor(max_workers=_WRITER_THREADS) as writer:
+            writes = []
+            for i, batch in enumerate(batches):
+                prompt = self.create_prompt(batch)
+                filename = f"prompt_{self.timestamp}_batch_{i+1}.txt"
+                filepath = self.output_dir / filename
+                
+                writes.append(writer.submit(_write_text, filepath, prompt))
+                
+                prompt_files.append(filename)
+                
+                # Update summary data with prompt file information
+                batch_files = set(d.filename for d in batch)
+                for summary_item in self.file_summary_data:
+                    if summary_item.scrap_file_name in batch_files:
+                        summary_item.prompt_files.append({
+                            'prompt_file_name': filename,
+                            'prompt_file_path': self.absolute_path(filepath),
+                            'batch_number': i + 1
+                        })
+                
+            # Surface any write error
+            for write in writes:
+                write.result()
         
         return prompt_files
     
@@ -313,49 +688,52 @@ Provide only the CSV data rows, no headers or additional text."""
             'prompt_files': prompt_files
         }
         
-        with open(self.output_dir / "summary.json", 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
+        _write_json(self.output_dir / "summary.json", summary)
     
     def save_comprehensive_summary(self) -> None:
         """Save comprehensive summary JSON file with all details"""
         comprehensive_summary = {
-            'processing_timestamp_utc': datetime.now(timezone.utc).isoformat(),
+            'processing_timestamp_utc': self.timestamp_iso,
             'extraction_session_id': self.timestamp,
-            'output_directory': str(self.output_dir.absolute()),
+            'output_directory': self.absolute_path(self.output_dir),
             'total_files_processed': len(self.file_summary_data),
-            'files_with_dates': len([f for f in self.file_summary_data if f['has_dates']]),
-            'files_without_dates': len([f for f in self.file_summary_data if not f['has_dates']]),
-            'total_dates_found': sum(f['dates_found'] for f in self.file_summary_data),
+            'files_with_dates': len([f for f in self.file_summary_data if f.has_dates]),
+            'files_without_dates': len([f for f in self.file_summary_data if not f.has_dates]),
+            'total_dates_found': sum(f.dates_found for f in self.file_summary_data),
             'file_details': []
         }
         
         for file_data in self.file_summary_data:
             file_detail = {
-                'scrap_file_name': file_data['scrap_file_name'],
-                'scrap_file_location': file_data['scrap_file_path'],
-                'source_url': file_data['url'],
-                'dates_found_count': file_data['dates_found'],
-                'has_business_dates': file_data['has_dates'],
-                'prompt_files': file_data.get('prompt_files', [])
+                'scrap_file_name': file_data.scrap_file_name,
+                'scrap_file_location': file_data.scrap_file_path,
+                'source_url': file_data.url,
+                'dates_found_count': file_data.dates_found,
+                'has_business_dates': file_data.has_dates,
+                'prompt_files': file_data.prompt_files
             }
             
-            if 'error' in file_data:
-                file_detail['processing_error'] = file_data['error']
+            if file_data.error is not None:
+                file_detail['processing_error'] = file_data.error
             
             comprehensive_summary['file_details'].append(file_detail)
         
         summary_filename = f"comprehensive_summary_{self.timestamp}.json"
-        with open(self.output_dir / summary_filename, 'w', encoding='utf-8') as f:
-            json.dump(comprehensive_summary, f, indent=2, ensure_ascii=False)
+        _write_json(self.output_dir / summary_filename, comprehensive_summary)
         
         print(f"📋 Comprehensive summary saved: {summary_filename}")
     
-    def run(self, directory: Optional[Path] = None, verbose: bool = True) -> Dict:
-        """Main execution method"""
+    def run(self, directory: Optional[Path] = None, verbose: bool = True,
+            files: Optional[List[Path]] = None) -> Dict:
+        """Main execution method
+        
+        Callers that already listed the scrap files can pass them as files to
+        skip scanning the directory again.
+        """
         if verbose:
             print("🔍 Looking for Scrap_*.txt files...")
         
-        scrap_files = self.find_scrap_files(directory)
+        scrap_files = files if files is not None else self.find_scrap_files(directory)
         
         if not scrap_files:
             if verbose:
@@ -402,8 +780,8 @@ Provide only the CSV data rows, no headers or additional text."""
 class DateExtractionPipeline(DateExtractorBase):
     """Advanced date extraction pipeline (based on date_extraction_script.py)"""
     
-    def __init__(self, max_tokens: int = 3500):
-        super().__init__(max_tokens, "date_extraction_output")
+    def __init__(self, max_tokens: int = 3500, max_workers: Optional[int] = None):
+        super().__init__(max_tokens, "date_extraction_output", max_workers)
     
     def split_into_chunks(self, text: str, max_chunk_tokens: int = 2000) -> List[str]:
         """Split large text into manageable chunks"""
@@ -412,234 +790,238 @@ class DateExtractionPipeline(DateExtractorBase):
         
         sentences = re.split(r'[.!?]+', text)
         chunks = []
-        current_chunk = ""
+        current_sentences = []
+        current_tokens = 0
+        
+        # Each sentence is tokenized once; the running chunk size is the sum of its
+        # sentence counts plus one token per joining space, rather than
+        # re-tokenizing the growing chunk after every sentence. BPE merges across
+        # the joins don't guarantee that sum is an upper bound, so every finished
+        # chunk is counted once more (see _finish_chunk)
+        for sentence, tokens in zip(sentences, self.count_tokens_many(sentences)):
+            if current_sentences and current_tokens + 1 + tokens > max_chunk_tokens:
+                chunks.extend(self._finish_chunk(current_sentences, max_chunk_tokens))
+                current_sentences = [sentence]
+                current_tokens = tokens
+            else:
+                current_tokens += tokens + 1 if current_sentences else tokens
+                current_sentences.append(sentence)
+        
+        if " ".join(current_sentences).strip():
+            chunks.extend(self._finish_chunk(current_sentences, max_chunk_tokens))
         
+        return chunks
+    
+    def _finish_chunk(self, sentences: List[str], max_chunk_tokens: int) -> List[str]:
+        """Join sentences into a chunk, re-splitting it if its real token count is too high
+        
+        The re-split is the exact greedy method that re-tokenizes the growing
+        chunk; it only runs in the rare case the estimate was too low.
+        """
+        chunk = " ".join(sentences).strip()
+        if len(sentences) == 1 or self.count_tokens(chunk) <= max_chunk_tokens:
+            return [chunk]
+        
+        chunks = []
+        current_chunk = ""
         for sentence in sentences:
             test_chunk = current_chunk + " " + sentence if current_chunk else sentence
-            if self.count_tokens(test_chunk) > max_chunk_tokens and current_chunk:
+            if current_chunk and self.count_tokens(test_chunk) > max_chunk_tokens:
                 chunks.append(current_chunk.strip())
                 current_chunk = sentence
             else:
                 current_chunk = test_chunk
-        
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-        
+        chunks.append(current_chunk.strip())
         return chunks
     
-    def process_file(self, filepath: Path, verbose: bool = True) -> bool:
-        """Process a single file"""
+    def scan_file(self, filepath: Path) -> Tuple[List[DateMatch], FileSummary, List[int]]:
+        """Extract dates from a single file without modifying pipeline state
+        
+        Returns the matches, the file summary data and the number of matches per chunk
+        """
+        # Name and absolute path are derived once and shared by every record of the file
+        file_name = filepath.name
+        file_path_str = self.absolute_path(filepath)
         try:
-            if verbose:
-                print(f"  Processing: {filepath.name}")
-            
-            # Extract URL from file
-            url = self.extract_url_from_file(filepath)
-            
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            # Extract URL and content from file
+            url, content = self.read_scrap_file(filepath)
             
             chunks = self.split_into_chunks(content)
-            file_has_dates = False
-            dates_count = 0
+            matches = []
+            chunk_counts = []
             
             for i, chunk in enumerate(chunks):
-                chunk_name = f"{filepath.name}_chunk_{i+1}" if len(chunks) > 1 else filepath.name
-                matches = self.find_dates_in_text(chunk, chunk_name, url)
-                if matches:
-                    file_has_dates = True
-                    dates_count += len(matches)
-                    self.results.extend(matches)
-                    if verbose:
-                        print(f"    Found {len(matches)} dates in {'chunk ' + str(i+1) if len(chunks) > 1 else 'file'}")
-            
-            # Store summary data
-            self.file_summary_data.append({
-                'scrap_file_name': filepath.name,
-                'scrap_file_path': str(filepath.absolute()),
-                'url': url or 'Not available',
-                'dates_found': dates_count,
-                'has_dates': file_has_dates
-            })
-            
-            if not file_has_dates:
-                self.no_dates_files.append(str(filepath))
-                if verbose:
-                    print(f"    No dates found in {filepath.name}")
+                chunk_name = f"{file_name}_chunk_{i+1}" if len(chunks) > 1 else file_name
+                chunk_matches = self.find_dates_in_text(chunk, chunk_name, url)
+                matches.extend(chunk_matches)
+                chunk_counts.append(len(chunk_matches))
             
-            return file_has_dates
+            return matches, FileSummary(
+                scrap_file_name=file_name,
+                scrap_file_path=file_path_str,
+                url=url or 'Not available',
+                dates_found=len(matches),
+                has_dates=bool(matches)
+            ), chunk_counts
                 
         except Exception as e:
-            if verbose:
-                print(f"    ERROR processing {filepath}: {e}")
             # Store error in summary data
-            self.file_summary_data.append({
-                'scrap_file_name': filepath.name,
-                'scrap_file_path': str(filepath.absolute()),
-                'url': 'Error extracting',
-                'dates_found': 0,
-                'has_dates': False,
-                'error': str(e)
-            })
+            return [], FileSummary(
+                scrap_file_name=file_name,
+                scrap_file_path=file_path_str,
+                url='Error extracting',
+                dates_found=0,
+                has_dates=False,
+                error=str(e)
+            ), []
+    
+    def process_file(self, filepath: Path, verbose: bool = True) -> bool:
+        """Process a single file"""
+        if verbose:
+            print(f"  Processing: {filepath.name}")
+        return self.record_file_result(filepath, self.scan_file(filepath), verbose)
+    
+    def record_file_result(self, filepath: Path, scan_result: Tuple[List[DateMatch], FileSummary, List[int]],
+                           verbose: bool = True) -> bool:
+        """Add the result of scan_file to the pipeline state"""
+        matches, summary, chunk_counts = scan_result
+        self.file_summary_data.append(summary)
+        
+        if summary.error is not None:
+            if verbose:
+                print(f"    ERROR processing {filepath}: {summary.error}")
             return False
+        
+        self.results.extend(matches)
+        if verbose:
+            for i, count in enumerate(chunk_counts):
+                if count:
+                    print(f"    Found {count} dates in {'chunk ' + str(i+1) if len(chunk_counts) > 1 else 'file'}")
+        
+        if not matches:
+            self.no_dates_files.append(str(filepath))
+            if verbose:
+                print(f"    No dates found in {filepath.name}")
+        
+        return bool(matches)
     
-    def find_dates_in_text(self, text: str, filename: str, url: Optional[str] = None) -> List[Dict]:
+    def find_dates_in_text(self, text: str, filename: str, url: Optional[str] = None) -> List[DateMatch]:
         """Find ALL date patterns in text"""
         matches = []
         clean_text = self.clean_text(text)
-        found_positions = set()
+        word_index = self.build_word_index(clean_text)
         
-        for pattern in self.date_patterns:
-            for match in re.finditer(pattern, clean_text, re.IGNORECASE):
-                if any(abs(match.start() - pos) < 10 for pos in found_positions):
-                    continue
-                    
-                found_positions.add(match.start())
-                context = self.extract_context(clean_text, match.start(), match.end())
-                
-                matches.append({
-                    'filename': filename,
-                    'date_found': match.group(0),
-                    'context': context,
-                    'position': match.start(),
-                    'pattern_used': pattern,
-                    'url': url or 'Not available'
-                })
+        for pattern, match in self._scan_dates(clean_text):
+            context = self.extract_context(clean_text, match.start(), match.end(),
+                                           word_index=word_index)
+            
+            matches.append(DateMatch(
+                filename=filename,
+                date=match.group(0),
+                context=context,
+                position=match.start(),
+                url=url or 'Not available',
+                pattern_used=pattern
+            ))
         
         return matches
     
-    def create_prompt_template(self, matches: List[Dict]) -> str:
+    def create_prompt_template(self, matches: List[DateMatch]) -> str:
         """Create comprehensive prompt for LLM analysis with CSV output"""
-        contexts_by_file = {}
+        contexts_by_file = defaultdict(list)
         for match in matches:
-            filename = match['filename']
-            if filename not in contexts_by_file:
-                contexts_by_file[filename] = {
-                    'url': match['url'],
-                    'matches': []
-                }
-            contexts_by_file[filename]['matches'].append({
-                'date': match['date_found'],
-                'context': match['context']
-            })
-        
-        context_sections = []
-        for filename, file_data in contexts_by_file.items():
-            context_sections.append(f"=== SOURCE: {filename} ===")
-            context_sections.append(f"URL: {file_data['url']}")
-            context_sections.append("")
-            for match in file_data['matches']:
-                context_sections.append(f"Date Found: {match['date']}")
-                context_sections.append(f"Context: {match['context']}")
-                context_sections.append("---")
-        
-        context_text = "\n".join(context_sections)
-        
-        return f"""You are analyzing text from web scraping to identify business-critical dates. Below are text snippets containing various dates. Your task is to identify and categorize dates that relate to product lifecycle, support, or business operations.
-
-TEXT TO ANALYZE:
-{context_text}
-
-TASK: Analyze each date found and determine if it relates to any of these categories:
-1. End of Life (EOL) - When product stops being manufactured
-2. End of Sales (EOS) - Last date for purchasing  
-3. End of Service/Support - When support/service ends
-4. End of Security Updates - When security patches stop
-5. Last Order Date - Final date to place orders
-6. Retirement/Discontinuation Date - When product is retired
-7. Migration Deadline - When users must migrate to new solution
-8. Contract Expiration - When agreements/licenses expire
-9. Other Business Critical Dates - Any other important business dates
-
-For each relevant date you identify, provide:
-- Product/service name if mentioned
-- The exact date
-- Category (from list above)
-- Source context (brief quote showing how date was mentioned)
-- URL (from the source file)
-- Confidence level (High/Medium/Low)
-
-IMPORTANT: 
-- Only include dates that appear to be business/product related
-- Ignore random dates, publication dates, or irrelevant timestamps
-- If a date's purpose is unclear, mark confidence as "Low"
-- If no relevant dates are found, respond with a single row: "No business-critical dates identified","","","","",""
-
-RESPOND IN CSV FORMAT:
-"product","date","category","context","url","confidence"
-
-Provide only the CSV data rows, no headers or additional text."""
+            contexts_by_file[match.filename].append(match)
+        
+        context_sections = [_PIPELINE_PROMPT_HEADER]
+        append = context_sections.append
+        for filename, file_matches in contexts_by_file.items():
+            # All matches from the same file share its URL
+            append(f"=== SOURCE: {filename} ===\nURL: {file_matches[0].url}\n")
+            for match in file_matches:
+                append(f"Date Found: {match.date}\nContext: {match.context}\n---")
+        append(_PIPELINE_PROMPT_FOOTER)
+        
+        return "\n".join(context_sections)
     
-    def group_into_batches(self) -> List[List[Dict]]:
+    def group_into_batches(self) -> List[List[DateMatch]]:
         """Group matches into token-appropriate batches"""
         batches = []
-        current_batch = []
-        current_tokens = 0
+        budget = self.max_tokens - 800
+        
+        sorted_results = sorted(self.results, key=lambda x: x.filename)
         
-        sorted_results = sorted(self.results, key=lambda x: x['filename'])
+        token_counts = self.count_tokens_many([m.context for m in sorted_results])
+        # prefix[k] is the token total of the first k matches, so each batch's
+        # end is found with one bisect instead of a per-match Python loop
+        prefix = [0, *accumulate(token_counts)]
         
-        for match in sorted_results:
-            match_tokens = self.count_tokens(match['context'])
+        start = i = 0  # current batch is sorted_results[start:i]
+        count = len(sorted_results)
+        while i < count:
+            if start == i and token_counts[i] > budget:
+                # A match too large for an empty batch is split on its own
+                match = sorted_results[i]
+                for chunk in self.split_into_chunks(match.context, 1500):
+                    batches.append([replace(match, context=chunk)])
+                start = i = i + 1
+                continue
             
-            if current_tokens + match_tokens > self.max_tokens - 800:
-                if current_batch:
-                    batches.append(current_batch)
-                    current_batch = [match]
-                    current_tokens = match_tokens
-                else:
-                    chunks = self.split_into_chunks(match['context'], 1500)
-                    for chunk in chunks:
-                        batches.append([{**match, 'context': chunk}])
-            else:
-                current_batch.append(match)
-                current_tokens += match_tokens
+            # Take every following match that still fits within the budget
+            i = max(i, bisect.bisect_right(prefix, prefix[start] + budget, i) - 1)
+            if i < count:
+                # The next match overflows: close the batch, it opens the next one
+                batches.append(sorted_results[start:i])
+                start, i = i, i + 1
         
-        if current_batch:
-            batches.append(current_batch)
+        if start < count:
+            batches.append(sorted_results[start:])
         
         return batches
     
-    def generate_output_files(self, batches: List[List[Dict]]) -> List[str]:
+    def generate_output_files(self, batches: List[List[DateMatch]]) -> List[str]:
         """Generate prompt and metadata files"""
         self.create_output_directory()
         prompt_files = []
         
-        for i, batch in enumerate(batches):
-            prompt = self.create_prompt_template(batch)
-            
-            prompt_filename = f"prompt_{self.timestamp}_batch_{i+1}.txt"
-            prompt_path = self.output_dir / prompt_filename
-            
-            with open(prompt_path, 'w', encoding='utf-8') as f:
-                f.write(prompt)
-            
-            prompt_files.append(prompt_filename)
-            
-            # Update summary data with prompt file information
-            batch_files = set(d['filename'].split('_chunk_')[0] if '_chunk_' in d['filename'] else d['filename'] for d in batch)
-            for summary_item in self.file_summary_data:
-                if summary_item['scrap_file_name'] in batch_files:
-                    if 'prompt_files' not in summary_item:
-                        summary_item['prompt_files'] = []
-                    summary_item['prompt_files'].append({
-                        'prompt_file_name': prompt_filename,
-                        'prompt_file_path': str(prompt_path.absolute()),
-                        'batch_number': i + 1
-                    })
-            
-            # Save batch metadata
-            metadata_filename = f"batch_{i+1}_metadata.json"
-            with open(self.output_dir / metadata_filename, 'w', encoding='utf-8') as f:
-                json.dump(batch, f, indent=2, ensure_ascii=False)
+        with ThreadPoolExecutor(max_workers=_WRITER_THREADS) as writer:
+            writes = []
+            for i, batch in enumerate(batches):
+                prompt = self.create_prompt_template(batch)
+                
+                prompt_filename = f"prompt_{self.timestamp}_batch_{i+1}.txt"
+                prompt_path = self.output_dir / prompt_filename
+                
+                writes.append(writer.submit(_write_text, prompt_path, prompt))
+                
+                prompt_files.append(prompt_filename)
+                
+                # Update summary data with prompt file information
+                batch_files = set(d.filename.split('_chunk_')[0] if '_chunk_' in d.filename else d.filename for d in batch)
+                for summary_item in self.file_summary_data:
+                    if summary_item.scrap_file_name in batch_files:
+                        summary_item.prompt_files.append({
+                            'prompt_file_name': prompt_filename,
+                            'prompt_file_path': self.absolute_path(prompt_path),
+                            'batch_number': i + 1
+                        })
+                
+                # Save batch metadata
+                metadata_filename = f"batch_{i+1}_metadata.json"
+                writes.append(writer.submit(_write_json, self.output_dir / metadata_filename,
+                                            [m.to_metadata() for m in batch]))
+                
+            # Surface any write error
+            for write in writes:
+                write.result()
         
         return prompt_files
     
     def save_comprehensive_summary(self, scrap_files: List[Path], prompt_files: List[str]) -> None:
         """Save comprehensive processing summary"""
         comprehensive_summary = {
-            'processing_timestamp_utc': datetime.now(timezone.utc).isoformat(),
+            'processing_timestamp_utc': self.timestamp_iso,
             'extraction_session_id': self.timestamp,
-            'output_directory': str(self.output_dir.absolute()),
+            'output_directory': self.absolute_path(self.output_dir),
             'total_files_processed': len(scrap_files),
             'files_with_dates': len(scrap_files) - len(self.no_dates_files),
             'files_without_dates': len(self.no_dates_files),
@@ -650,23 +1032,22 @@ Provide only the CSV data rows, no headers or additional text."""
         
         for file_data in self.file_summary_data:
             file_detail = {
-                'scrap_file_name': file_data['scrap_file_name'],
-                'scrap_file_location': file_data['scrap_file_path'],
-                'source_url': file_data['url'],
-                'dates_found_count': file_data['dates_found'],
-                'has_business_dates': file_data['has_dates'],
-                'prompt_files': file_data.get('prompt_files', [])
+                'scrap_file_name': file_data.scrap_file_name,
+                'scrap_file_location': file_data.scrap_file_path,
+                'source_url': file_data.url,
+                'dates_found_count': file_data.dates_found,
+                'has_business_dates': file_data.has_dates,
+                'prompt_files': file_data.prompt_files
             }
             
-            if 'error' in file_data:
-                file_detail['processing_error'] = file_data['error']
+            if file_data.error is not None:
+                file_detail['processing_error'] = file_data.error
             
             comprehensive_summary['file_details'].append(file_detail)
         
         # Save comprehensive summary
         summary_filename = f"comprehensive_summary_{self.timestamp}.json"
-        with open(self.output_dir / summary_filename, 'w', encoding='utf-8') as f:
-            json.dump(comprehensive_summary, f, indent=2, ensure_ascii=False)
+        _write_json(self.output_dir / summary_filename, comprehensive_summary)
         
         # Also save the original extraction summary for backward compatibility
         original_summary = {
@@ -682,19 +1063,23 @@ Provide only the CSV data rows, no headers or additional text."""
             'prompt_files_generated': prompt_files
         }
         
-        with open(self.output_dir / "extraction_summary.json", 'w', encoding='utf-8') as f:
-            json.dump(original_summary, f, indent=2, ensure_ascii=False)
+        _write_json(self.output_dir / "extraction_summary.json", original_summary)
         
         print(f"📋 Comprehensive summary saved: {summary_filename}")
     
-    def run_pipeline(self, directory: Optional[Path] = None, verbose: bool = True) -> Dict:
-        """Run the complete extraction pipeline"""
+    def run_pipeline(self, directory: Optional[Path] = None, verbose: bool = True,
+                     files: Optional[List[Path]] = None) -> Dict:
+        """Run the complete extraction pipeline
+        
+        Callers that already listed the scrap files can pass them as files to
+        skip scanning the directory again.
+        """
         if verbose:
             print("=" * 60)
             print("STARTING DATE EXTRACTION PIPELINE")
             print("=" * 60)
         
-        scrap_files = self.find_scrap_files(directory)
+        scrap_files = files if files is not None else self.find_scrap_files(directory)
         
         if not scrap_files:
             if verbose:
@@ -710,8 +1095,10 @@ Provide only the CSV data rows, no headers or additional text."""
         self.no_dates_files = []
         self.file_summary_data = []
         
-        for filepath in scrap_files:
-            self.process_file(filepath, verbose)
+        for filepath, scan_result in zip(scrap_files, self.scan_files(scrap_files)):
+            if verbose:
+                print(f"  Processing: {filepath.name}")
+            self.record_file_result(filepath, scan_result, verbose)
         
         if verbose:
             print(f"\n📊 PROCESSING SUMMARY:")
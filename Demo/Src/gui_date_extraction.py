@@ -4,28 +4,59 @@ GUI Interface for Date Extraction Module
 Multiple approaches: Tkinter, Web Interface, and API endpoints
 """
 
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
-import threading
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import queue
 from pathlib import Path
 import json
 import webbrowser
 import os
-from datetime import datetime
+import subprocess
+import time
 import sys
 
-# Import the date extraction module
+# tkinter and the date extraction module are imported on first use, so the
+# callback API and the extraction worker process never pay for what they don't use
+tk = ttk = filedialog = messagebox = scrolledtext = None
+
+
+def _load_tk():
+    """Import tkinter into the module globals the first time a GUI is built"""
+    global tk, ttk, filedialog, messagebox, scrolledtext
+    if tk is None:
+        from tkinter import ttk, filedialog, messagebox, scrolledtext
+        import tkinter
+        tk = tkinter
+
+
+@functools.lru_cache(maxsize=None)
+def _load_module():
+    """Import the date extraction module; None if it is not available"""
+    try:
+        import date_extraction_module
+        return date_extraction_module
+    except ImportError:
+        print("⚠️  date_extraction_module not found. Please ensure it's in the same directory.")
+        return None
+
+# Use orjson to parse summary files when available
 try:
-    from date_extraction_module import (
-        run_simple_extraction,
-        run_advanced_pipeline,
-        SimpleDateExtractor,
-        DateExtractionPipeline
-    )
-    MODULE_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    MODULE_AVAILABLE = False
-    print("⚠️  date_extraction_module not found. Please ensure it's in the same directory.")
+    ORJSON_AVAILABLE = False
+
+
+def _run_extraction_worker(directory, mode, max_tokens, files):
+    """Run one extraction in the GUI's worker process and return its result dict"""
+    extraction = _load_module()
+    if mode == "simple":
+        extractor = extraction.SimpleDateExtractor(max_tokens=max_tokens)
+        return extractor.run(directory=directory, verbose=False, files=files)
+    
+    pipeline = extraction.DateExtractionPipeline(max_tokens=max_tokens)
+    return pipeline.run_pipeline(directory=directory, verbose=False, files=files)
 
 # =============================================================================
 # APPROACH 1: TKINTER GUI (Desktop Application)
@@ -33,6 +64,7 @@ except ImportError:
 
 class DateExtractionGUI:
     def __init__(self, root):
+        _load_tk()
         self.root = root
         self.root.title("Date Extraction Tool")
         self.root.geometry("800x600")
@@ -42,8 +74,14 @@ class DateExtractionGUI:
         self.extraction_mode = tk.StringVar(value="advanced")
         self.max_tokens = tk.IntVar(value=3500)
         self.is_running = False
+        self._executor = None  # Long-lived single-process pool that runs every extraction
+        self._summary_cache = None  # (path, mtime, parsed summary) of the last summary viewed
+        self._log_queue = queue.Queue()  # Log lines waiting for the next drain
+        self._last_ts_sec = None  # Second whose formatted timestamp is cached below
+        self._last_ts_str = ""
         
         self.setup_ui()
+        self.root.after(100, self._drain_log_queue)
         
     def setup_ui(self):
         # Main frame
@@ -141,11 +179,27 @@ class DateExtractionGUI:
             self.log_output(f"📁 Selected directory: {directory}")
     
     def log_output(self, message):
-        """Add message to output area"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.output_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.output_text.see(tk.END)
-        self.root.update_idletasks()
+        """Queue message for the output area (safe to call from the worker thread)"""
+        # Bursts of messages share one formatted timestamp per second
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        self._log_queue.put(f"[{self._last_ts_str}] {message}\n")
+    
+    def _drain_log_queue(self):
+        """Write all queued log lines with a single insert, then reschedule"""
+        batch = []
+        try:
+            while True:
+                batch.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if batch:
+            self.output_text.insert(tk.END, "".join(batch))
+            self.output_text.see(tk.END)
+        self.root.after(100, self._drain_log_queue)
     
     def clear_output(self):
         """Clear the output area"""
@@ -158,7 +212,8 @@ class DateExtractionGUI:
     
     def start_extraction(self):
         """Start the extraction process in a separate thread"""
-        if not MODULE_AVAILABLE:
+        extraction = _load_module()
+        if extraction is None:
             messagebox.showerror("Error", "Date extraction module not available!")
             return
         
@@ -166,51 +221,65 @@ class DateExtractionGUI:
             messagebox.showwarning("Warning", "Extraction is already running!")
             return
         
-        # Validate directory
+        # Validate directory and check for scrap files once; the list is handed to
+        # the extractor so the directory is only scanned once per run
         directory = Path(self.selected_directory.get())
-        if not directory.exists():
+        if not directory.is_dir():
             messagebox.showerror("Error", f"Directory does not exist: {directory}")
             return
         
-        # Check for scrap files
-        scrap_files = list(directory.glob("Scrap_*.txt"))
+        scrap_files = extraction.DateExtractorBase.find_scrap_files(directory)
+        
         if not scrap_files:
             messagebox.showwarning("Warning", f"No Scrap_*.txt files found in {directory}")
             return
         
-        # Start extraction in separate thread
+        mode = self.extraction_mode.get()
+        max_tokens = self.max_tokens.get()
+        
+        # Start extraction in a separate process so it never competes with Tk for the GIL
         self.is_running = True
         self.extract_button.config(state='disabled', text="⏳ Processing...")
         self.progress.start()
         
-        thread = threading.Thread(target=self.run_extraction, daemon=True)
-        thread.start()
+        self.update_status("Starting extraction...")
+        self.log_output(f"🔍 Starting {mode} extraction in {directory}")
+        self.log_output(f"📊 Max tokens per batch: {max_tokens}")
+        
+        try:
+            future = self._get_executor().submit(_run_extraction_worker, directory, mode,
+                                                 max_tokens, scrap_files)
+        except BrokenProcessPool:
+            # The worker died while idle; start a new pool for this run
+            self._executor = None
+            future = self._get_executor().submit(_run_extraction_worker, directory, mode,
+                                                 max_tokens, scrap_files)
+        self.root.after(100, self._poll_extraction, future)
+    
+    def _get_executor(self):
+        """Return the extraction worker pool, creating it on first use"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=1)
+        return self._executor
     
-    def run_extraction(self):
-        """Run the actual extraction process"""
+    def _poll_extraction(self, future):
+        """Check the worker's future from the Tk main loop and handle its outcome once done"""
+        # Polled rather than a done-callback, which would run on the pool's
+        # management thread where Tk must not be called
+        if not future.done():
+            self.root.after(100, self._poll_extraction, future)
+            return
+        
         try:
-            directory = Path(self.selected_directory.get())
-            mode = self.extraction_mode.get()
-            max_tokens = self.max_tokens.get()
-            
-            self.update_status("Starting extraction...")
-            self.log_output(f"🔍 Starting {mode} extraction in {directory}")
-            self.log_output(f"📊 Max tokens per batch: {max_tokens}")
-            
-            # Run extraction based on mode
-            if mode == "simple":
-                extractor = SimpleDateExtractor(max_tokens=max_tokens)
-                result = extractor.run(directory=directory, verbose=False)
-            else:
-                pipeline = DateExtractionPipeline(max_tokens=max_tokens)
-                result = pipeline.run_pipeline(directory=directory, verbose=False)
-            
-            # Update UI in main thread
-            self.root.after(0, self.extraction_completed, result)
-            
+            result = future.result()
         except Exception as e:
-            error_msg = f"Error during extraction: {str(e)}"
-            self.root.after(0, self.extraction_error, error_msg)
+            if isinstance(e, BrokenProcessPool):
+                # A dead worker takes the pool down; the next run starts a new one
+                self._executor = None
+            self.extraction_error(f"Error during extraction: {str(e)}")
+            return
+        
+        self.extraction_completed(result)
     
     def extraction_completed(self, result):
         """Handle successful extraction completion"""
@@ -257,9 +326,9 @@ class DateExtractionGUI:
                 if sys.platform == "win32":
                     os.startfile(output_dir)
                 elif sys.platform == "darwin":
-                    os.system(f"open '{output_dir}'")
+                    subprocess.Popen(["open", output_dir], close_fds=True)
                 else:
-                    os.system(f"xdg-open '{output_dir}'")
+                    subprocess.Popen(["xdg-open", output_dir], close_fds=True)
             else:
                 messagebox.showerror("Error", f"Output directory not found: {output_dir}")
         else:
@@ -274,8 +343,7 @@ class DateExtractionGUI:
             if summary_files:
                 summary_file = summary_files[0]
                 try:
-                    with open(summary_file, 'r', encoding='utf-8') as f:
-                        summary_data = json.load(f)
+                    summary_data = self.load_summary(summary_file)
                     
                     # Create summary window
                     self.show_summary_window(summary_data)
@@ -287,6 +355,22 @@ class DateExtractionGUI:
         else:
             messagebox.showwarning("Warning", "No successful extraction completed yet!")
     
+    def load_summary(self, summary_file):
+        """Parse a summary file, reusing the last parsed one while its mtime is unchanged"""
+        # Only the most recent summary is kept; every run writes a new one
+        key = str(summary_file)
+        mtime = os.path.getmtime(key)
+        if self._summary_cache and self._summary_cache[:2] == (key, mtime):
+            return self._summary_cache[2]
+        
+        if ORJSON_AVAILABLE:
+            summary_data = orjson.loads(summary_file.read_bytes())
+        else:
+            with open(summary_file, 'r', encoding='utf-8') as f:
+                summary_data = json.load(f)
+        self._summary_cache = (key, mtime, summary_data)
+        return summary_data
+    
     def show_summary_window(self, summary_data):
         """Show summary in a new window"""
         summary_window = tk.Toplevel(self.root)
@@ -317,13 +401,16 @@ OUTPUT:
 FILE DETAILS:
 """
         
-        for i, file_detail in enumerate(summary_data.get('file_details', []), 1):
-            summary_text += f"\n{i}. {file_detail.get('scrap_file_name', 'Unknown')}\n"
-            summary_text += f"   URL: {file_detail.get('source_url', 'N/A')}\n"
-            summary_text += f"   Dates found: {file_detail.get('dates_found_count', 0)}\n"
-            summary_text += f"   Has dates: {'Yes' if file_detail.get('has_business_dates', False) else 'No'}\n"
-        
-        text_area.insert(tk.END, summary_text)
+        # Build the whole text with one join and insert it into the widget once
+        parts = [summary_text]
+        parts.extend(
+            f"\n{i}. {file_detail.get('scrap_file_name', 'Unknown')}\n"
+            f"   URL: {file_detail.get('source_url', 'N/A')}\n"
+            f"   Dates found: {file_detail.get('dates_found_count', 0)}\n"
+            f"   Has dates: {'Yes' if file_detail.get('has_business_dates', False) else 'No'}\n"
+            for i, file_detail in enumerate(summary_data.get('file_details', []), 1)
+        )
+        text_area.insert(tk.END, "".join(parts))
         text_area.config(state=tk.DISABLED)
 
 # =============================================================================
@@ -334,6 +421,7 @@ class SimpleButtonIntegration:
     """Simple class that can be integrated into existing applications"""
     
     def __init__(self, parent_widget=None):
+        _load_tk()
         self.parent = parent_widget
         self.last_result = None
     
@@ -356,7 +444,7 @@ class SimpleButtonIntegration:
             progress_window = self.show_progress_dialog()
             
             # Run extraction
-            result = run_advanced_pipeline(directory=Path(directory), verbose=False)
+            result = _load_module().run_advanced_pipeline(directory=Path(directory), verbose=False)
             
             # Close progress dialog
             progress_window.destroy()
@@ -409,9 +497,9 @@ class SimpleButtonIntegration:
             if sys.platform == "win32":
                 os.startfile(folder_path)
             elif sys.platform == "darwin":
-                os.system(f"open '{folder_path}'")
+                subprocess.Popen(["open", folder_path], close_fds=True)
             else:
-                os.system(f"xdg-open '{folder_path}'")
+                subprocess.Popen(["xdg-open", folder_path], close_fds=True)
         except Exception as e:
             print(f"Could not open folder: {e}")
 
@@ -446,11 +534,12 @@ class CallbackBasedExtraction:
                 self.on_progress("Initializing extraction...")
             
             # Run extraction
+            extraction = _load_module()
             if mode == "simple":
-                extractor = SimpleDateExtractor(max_tokens=max_tokens)
+                extractor = extraction.SimpleDateExtractor(max_tokens=max_tokens)
                 result = extractor.run(directory=Path(directory), verbose=False)
             else:
-                pipeline = DateExtractionPipeline(max_tokens=max_tokens)
+                pipeline = extraction.DateExtractionPipeline(max_tokens=max_tokens)
                 result = pipeline.run_pipeline(directory=Path(directory), verbose=False)
             
             # Notify completion
@@ -479,12 +568,14 @@ class CallbackBasedExtraction:
 
 def example_full_gui():
     """Example: Full GUI application"""
+    _load_tk()
     root = tk.Tk()
     app = DateExtractionGUI(root)
     root.mainloop()
 
 def example_simple_integration():
     """Example: Simple button integration"""
+    _load_tk()
     root = tk.Tk()
     root.title("My Application")
     root.geometry("400x200")
@@ -1,20 +1,89 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox
 import json
-import pandas as pd
 import os
-import glob
+import io
+import codecs
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# Use orjson to parse the summary JSON when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Summaries at least this large are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD = 1 << 20
+
+# Rows inserted into the results table per event-loop tick
+TREE_INSERT_CHUNK = 500
+
+# File viewer text is streamed into the widget in chunks, up to a size cap
+VIEWER_CHUNK_CHARS = 256 * 1024
+VIEWER_MAX_CHARS = 50 * 1024 * 1024
+VIEWER_TRUNCATED_NOTE = "\n\n[File truncated - too large to display in full]"
+
+
+def read_viewer_chunks(file_path):
+    """Yield the text of a file in chunks for the viewer, reading the file once
+    
+    The file is shown as UTF-8, or as latin-1 when its first chunk is not valid
+    UTF-8; later bytes that don't decode are replaced. Newlines are translated
+    as in text mode. Past VIEWER_MAX_CHARS a truncation note ends the text.
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read(VIEWER_CHUNK_CHARS)
+        try:
+            # A character cut off at the end of the chunk is not an error here
+            codecs.getincrementaldecoder('utf-8')().decode(data)
+            encoding = 'utf-8'
+        except UnicodeDecodeError:
+            encoding = 'latin-1'
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(errors='replace'), translate=True)
+        
+        shown = 0
+        while data and shown < VIEWER_MAX_CHARS:
+            chunk = decoder.decode(data)
+            shown += len(chunk)
+            yield chunk
+            data = f.read(VIEWER_CHUNK_CHARS)
+        
+        if data:
+            yield VIEWER_TRUNCATED_NOTE
+        else:
+            yield decoder.decode(b'', final=True)
+
+# How long copy confirmations stay in a window's status label
+STATUS_FLASH_MS = 1500
+
+# Record fields in table column order
+RESULT_FIELDS = ('scrap_file_name', 'scrap_file_location', 'source_url',
+                 'prompt_file_name', 'prompt_file_path', 'batch_number')
+RESULT_FIELD_LABELS = tuple(field.replace('_', ' ').title() for field in RESULT_FIELDS)
+
+# Table column headings, one per RESULT_FIELDS entry; also the CSV export header
+RESULT_COLUMNS = ('Scrap File Name', 'Scrap File Location', 'Source URL',
+                  'Prompt File Name', 'Prompt File Path', 'Batch Number')
+
 class ResultsDisplayManager:
     """Manages the display and export of scraping results"""
     
     def __init__(self, parent_frame, logger=None):
         self.parent_frame = parent_frame
         self.logger = logger
-        self.results_data = []
+        self.results_data = []  # One tuple per table row, values in RESULT_FIELDS order
         self.raw_data = None  # Store the original JSON data
         self.latest_json_file = None
+        self._populate_job = None  # Pending after() call that inserts the next chunk of rows
+        self._shown_rows = []  # Rows the table is displaying (or still filling in)
+        self._inserted_count = 0  # How many of _shown_rows are in the table so far
+        self._loader = ThreadPoolExecutor(max_workers=1)  # Reads and parses summaries off the Tk thread
+        self._loaded_key = None  # (path, mtime_ns, size) of the summary whose rows are displayed
+        self._refresh_job = None  # Pending debounced refresh
         self.create_results_display()
     
     def create_results_display(self):
@@ -51,7 +120,7 @@ class ResultsDisplayManager:
         self.refresh_button = ttk.Button(
             self.buttons_frame, 
             text="Refresh Results", 
-            command=self.load_latest_results
+            command=self.schedule_refresh
         )
         self.refresh_button.grid(row=0, column=1, sticky=tk.E)
         
@@ -67,7 +136,7 @@ class ResultsDisplayManager:
         self.table_frame.rowconfigure(0, weight=1)
         
         # Define columns for file details
-        columns = ('Scrap File Name', 'Scrap File Location', 'Source URL', 'Prompt File Name', 'Prompt File Path', 'Batch Number')
+        columns = RESULT_COLUMNS
         
         # Create treeview with horizontal and vertical scrolling
         self.results_tree = ttk.Treeview(
@@ -124,9 +193,9 @@ class ResultsDisplayManager:
         if not selection:
             return
         
-        # Get the index of the selected item
+        # Rows are inserted with their results_data index as the item id
         item_id = selection[0]
-        item_index = self.results_tree.index(item_id)
+        item_index = int(item_id)
         
         # Get the corresponding data from results_data
         if 0 <= item_index < len(self.results_data):
@@ -197,19 +266,12 @@ class ResultsDisplayManager:
             v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
             h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
             
-            # Read and display file content
+            # Read and display file content chunk by chunk, so the window renders
+            # progressively and neither Python nor Tk holds an extra full copy
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                text_widget.insert(tk.END, content)
-            except UnicodeDecodeError:
-                # Try with different encoding if UTF-8 fails
-                try:
-                    with open(file_path, 'r', encoding='latin-1') as f:
-                        content = f.read()
-                    text_widget.insert(tk.END, content)
-                except Exception as e:
-                    text_widget.insert(tk.END, f"Error reading file: {str(e)}")
+                for chunk in read_viewer_chunks(file_path):
+                    text_widget.insert(tk.END, chunk)
+                    text_widget.update_idletasks()
             except Exception as e:
                 text_widget.insert(tk.END, f"Error reading file: {str(e)}")
             
@@ -250,7 +312,7 @@ class ResultsDisplayManager:
                     selected_text = text_widget.selection_get()
                     notepad_window.clipboard_clear()
                     notepad_window.clipboard_append(selected_text)
-                    messagebox.showinfo("Copied", "Selected text copied to clipboard")
+                    self.flash_status(status_var, "Selected text copied to clipboard")
                 except tk.TclError:
                     messagebox.showwarning("Warning", "No text selected")
             
@@ -262,7 +324,7 @@ class ResultsDisplayManager:
                 all_text = text_widget.get("1.0", tk.END)
                 notepad_window.clipboard_clear()
                 notepad_window.clipboard_append(all_text)
-                messagebox.showinfo("Copied", "All text copied to clipboard")
+                self.flash_status(status_var, "All text copied to clipboard")
             
             copy_all_button = ttk.Button(button_frame, text="Copy All", command=copy_all)
             copy_all_button.grid(row=0, column=3, padx=5)
@@ -271,6 +333,11 @@ class ResultsDisplayManager:
             close_button = ttk.Button(button_frame, text="Close", command=notepad_window.destroy)
             close_button.grid(row=0, column=4, padx=(5, 0))
             
+            # Status label for copy confirmations (instead of modal message boxes)
+            status_var = tk.StringVar(notepad_window)
+            status_label = ttk.Label(button_frame, textvariable=status_var)
+            status_label.grid(row=0, column=5, padx=(10, 0), sticky=tk.W)
+            
             # Bind Ctrl+A to select all
             def ctrl_a(event):
                 select_all()
@@ -350,20 +417,9 @@ class ResultsDisplayManager:
         scrollbar_v.grid(row=0, column=1, sticky=(tk.N, tk.S))
         scrollbar_h.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
-        # Populate listbox with record data
-        field_order = ['scrap_file_name', 'scrap_file_location', 'source_url', 'prompt_file_name', 'prompt_file_path', 'batch_number']
-        
-        for field in field_order:
-            if field in record_data:
-                value = record_data[field]
-                display_text = f"{field.replace('_', ' ').title()}: {value}"
-                listbox.insert(tk.END, display_text)
-        
-        # Add any additional fields not in the standard order
-        for key, value in record_data.items():
-            if key not in field_order:
-                display_text = f"{key.replace('_', ' ').title()}: {value}"
-                listbox.insert(tk.END, display_text)
+        # Populate listbox with record data (a row tuple in RESULT_FIELDS order)
+        lines = [f"{label}: {value}" for label, value in zip(RESULT_FIELD_LABELS, record_data)]
+        listbox.insert(tk.END, *lines)
         
         # Buttons frame
         button_frame = ttk.Frame(main_frame)
@@ -376,7 +432,7 @@ class ResultsDisplayManager:
                 selected_text = listbox.get(selection[0])
                 popup.clipboard_clear()
                 popup.clipboard_append(selected_text)
-                messagebox.showinfo("Copied", f"Copied to clipboard:\n{selected_text}")
+                self.flash_status(status_var, "Line copied to clipboard")
             else:
                 messagebox.showwarning("Warning", "Please select a line to copy")
         
@@ -385,10 +441,10 @@ class ResultsDisplayManager:
         
         # Copy all data button
         def copy_all_data():
-            all_text = "\n".join([listbox.get(i) for i in range(listbox.size())])
+            all_text = "\n".join(listbox.get(0, tk.END))
             popup.clipboard_clear()
             popup.clipboard_append(all_text)
-            messagebox.showinfo("Copied", "All record data copied to clipboard")
+            self.flash_status(status_var, "All record data copied to clipboard")
         
         copy_all_button = ttk.Button(button_frame, text="Copy All Data", command=copy_all_data)
         copy_all_button.grid(row=0, column=1, padx=5)
@@ -397,6 +453,11 @@ class ResultsDisplayManager:
         close_button = ttk.Button(button_frame, text="Close", command=popup.destroy)
         close_button.grid(row=0, column=2, padx=(5, 0))
         
+        # Status label for copy confirmations (instead of modal message boxes)
+        status_var = tk.StringVar(popup)
+        status_label = ttk.Label(button_frame, textvariable=status_var)
+        status_label.grid(row=0, column=3, padx=(10, 0), sticky=tk.W)
+        
         # Modified double-click handler for listbox
         def on_listbox_double_click(event):
             selection = listbox.curselection()
@@ -423,24 +484,30 @@ class ResultsDisplayManager:
         # Focus on the listbox
         listbox.focus_set()
     
+    def flash_status(self, status_var, message):
+        """Show a message in a window's status label, clearing it after a short delay"""
+        status_var.set(message)
+        
+        def clear():
+            # Leave newer messages alone
+            if status_var.get() == message:
+                status_var.set("")
+        
+        # Scheduled on the parent frame, which outlives the popup windows
+        self.parent_frame.after(STATUS_FLASH_MS, clear)
+    
     def find_latest_subfolder(self):
         """Find the latest date_extraction_output_* subfolder"""
         try:
-            # Look for date_extraction_output_* folders in current directory
-            pattern = "date_extraction_output_*"
-            folders = glob.glob(pattern)
-            
-            if not folders:
-                return None
-            
-            # Filter to only include directories
-            folders = [f for f in folders if os.path.isdir(f)]
-            
-            if not folders:
-                return None
-            
-            # Sort by modification time to get the latest
-            latest_folder = max(folders, key=os.path.getmtime)
+            # Look for date_extraction_output_* folders in current directory; one
+            # scandir pass, DirEntry caches the type and stat of each entry
+            latest_folder, latest_mtime = None, None
+            with os.scandir('.') as entries:
+                for entry in entries:
+                    if entry.name.startswith("date_extraction_output_") and entry.is_dir():
+                        mtime = entry.stat().st_mtime
+                        if latest_mtime is None or mtime > latest_mtime:
+                            latest_folder, latest_mtime = entry.name, mtime
             return latest_folder
             
         except Exception as e:
@@ -452,15 +519,17 @@ class ResultsDisplayManager:
         """Find comprehensive_summary_*.json file in the given folder"""
         try:
             # Look for comprehensive_summary_*.json files in the folder
-            pattern = os.path.join(folder_path, "comprehensive_summary_*.json")
-            json_files = glob.glob(pattern)
-            
-            if not json_files:
+            latest_file, latest_mtime = None, None
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith("comprehensive_summary_") and entry.name.endswith(".json"):
+                        mtime = entry.stat().st_mtime
+                        if latest_mtime is None or mtime > latest_mtime:
+                            latest_file, latest_mtime = entry.name, mtime
+            
+            if latest_file is None:
                 return None
-            
-            # Sort by modification time to get the latest
-            latest_file = max(json_files, key=os.path.getmtime)
-            return latest_file
+            return os.path.join(folder_path, latest_file)
             
         except Exception as e:
             if self.logger:
@@ -484,11 +553,19 @@ class ResultsDisplayManager:
             else:
                 return []
             
+            # The same prompt file (and often URL) is listed under many scrap
+            # files, and the parser returns a new string for every occurrence;
+            # share one object per distinct value across all rows
+            pool = {}
+            
+            def share(value):
+                return pool.setdefault(value, value)
+            
             # Process each file detail
             for file_detail in file_details:
                 scrap_file_name = file_detail.get('scrap_file_name', 'Unknown')
-                scrap_file_location = file_detail.get('scrap_file_location', 'Unknown')
-                source_url = file_detail.get('source_url', 'Unknown')
+                scrap_file_location = share(file_detail.get('scrap_file_location', 'Unknown'))
+                source_url = share(file_detail.get('source_url', 'Unknown'))
                 
                 # Handle prompt_files array
                 prompt_files = file_detail.get('prompt_files', [])
@@ -496,26 +573,18 @@ class ResultsDisplayManager:
                 if prompt_files:
                     # Create a row for each prompt file
                     for prompt_file in prompt_files:
-                        row = {
-                            'scrap_file_name': scrap_file_name,
-                            'scrap_file_location': scrap_file_location,
-                            'source_url': source_url,
-                            'prompt_file_name': prompt_file.get('prompt_file_name', 'Unknown'),
-                            'prompt_file_path': prompt_file.get('prompt_file_path', 'Unknown'),
-                            'batch_number': prompt_file.get('batch_number', 'Unknown')
-                        }
-                        file_details_list.append(row)
+                        file_details_list.append((
+                            scrap_file_name, scrap_file_location, source_url,
+                            share(prompt_file.get('prompt_file_name', 'Unknown')),
+                            share(prompt_file.get('prompt_file_path', 'Unknown')),
+                            prompt_file.get('batch_number', 'Unknown')
+                        ))
                 else:
                     # Create a row even if no prompt files
-                    row = {
-                        'scrap_file_name': scrap_file_name,
-                        'scrap_file_location': scrap_file_location,
-                        'source_url': source_url,
-                        'prompt_file_name': 'No prompt files',
-                        'prompt_file_path': 'No prompt files',
-                        'batch_number': 'N/A'
-                    }
-                    file_details_list.append(row)
+                    file_details_list.append((
+                        scrap_file_name, scrap_file_location, source_url,
+                        'No prompt files', 'No prompt files', 'N/A'
+                    ))
                     
         except Exception as e:
             if self.logger:
@@ -524,38 +593,98 @@ class ResultsDisplayManager:
         return file_details_list
     
     def load_latest_results(self):
-        """Load and display results from the latest comprehensive summary JSON file"""
+        """Load and display results from the latest comprehensive summary JSON file
+        
+        Finding and parsing the file runs on the loader thread; the widgets are
+        updated back on the Tk thread once it finishes.
+        """
+        future = self._loader.submit(self.read_latest_results, self._loaded_key)
+        self.parent_frame.after(50, self.poll_loaded_results, future)
+    
+    def poll_loaded_results(self, future):
+        """Apply the loader's result once it is done (polled, Tk is only called from its thread)"""
+        if not future.done():
+            self.parent_frame.after(50, self.poll_loaded_results, future)
+            return
+        self.apply_loaded_results(future)
+    
+    def schedule_refresh(self):
+        """Reload results 250 ms after the last request, so bursts run one load"""
+        if self._refresh_job is not None:
+            self.parent_frame.after_cancel(self._refresh_job)
+        self._refresh_job = self.parent_frame.after(250, self.run_scheduled_refresh)
+    
+    def run_scheduled_refresh(self):
+        """Run the refresh that schedule_refresh deferred"""
+        self._refresh_job = None
+        self.load_latest_results()
+    
+    def read_latest_results(self, loaded_key=None):
+        """Find, read and parse the latest summary (no Tk calls - runs on the loader thread)
+        
+        loaded_key is the key of the summary currently displayed, passed in so
+        this thread reads no display state. Returns (status message or None,
+        JSON file, its os.stat result, raw data, file details); raw data and
+        file details are None when the summary is unchanged since loaded_key.
+        """
+        # Find the latest subfolder
+        latest_folder = self.find_latest_subfolder()
+        
+        if not latest_folder:
+            return "No date_extraction_output folder found", None, None, None, []
+        
+        # Find comprehensive summary file in the folder
+        json_file = self.find_comprehensive_summary_file(latest_folder)
+        
+        if not json_file:
+            return f"No comprehensive_summary file found in {latest_folder}", None, None, None, []
+        
+        # Size is part of the key so a rewrite within the mtime resolution is still seen
+        st = os.stat(json_file)
+        if (json_file, st.st_mtime_ns, st.st_size) == loaded_key:
+            # Unchanged since it was last displayed - keep the current rows
+            return None, json_file, st, None, None
+        
+        # Load JSON data (orjson parses the raw bytes, no separate decode step)
+        if ORJSON_AVAILABLE:
+            with open(json_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                    # Parse straight from the page cache without copying the file
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        raw_data = orjson.loads(view)
+                else:
+                    raw_data = orjson.loads(f.read())
+        else:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                raw_data = json.load(f)
+        
+        # Extract file details from the JSON
+        results_data = self.extract_file_details(raw_data)
+        return None, json_file, st, raw_data, results_data
+    
+    def apply_loaded_results(self, future):
+        """Show the outcome of read_latest_results in the results display"""
         try:
-            # Find the latest subfolder
-            latest_folder = self.find_latest_subfolder()
-            
-            if not latest_folder:
-                self.results_info_var.set("No date_extraction_output folder found")
-                self.clear_results_table()
-                self.download_button.config(state='disabled')
-                return
+            status, json_file, st, raw_data, results_data = future.result()
+            self.latest_json_file = json_file
             
-            # Find comprehensive summary file in the folder
-            self.latest_json_file = self.find_comprehensive_summary_file(latest_folder)
-            
-            if not self.latest_json_file:
-                self.results_info_var.set(f"No comprehensive_summary file found in {latest_folder}")
+            if status:
+                self.results_info_var.set(status)
                 self.clear_results_table()
+                self._loaded_key = None
                 self.download_button.config(state='disabled')
                 return
             
-            # Load JSON data
-            with open(self.latest_json_file, 'r', encoding='utf-8') as f:
-                self.raw_data = json.load(f)
-            
-            # Extract file details from the JSON
-            self.results_data = self.extract_file_details(self.raw_data)
-            
-            # Update display
-            self.display_results()
+            if results_data is not None:
+                self.raw_data = raw_data
+                self.results_data = results_data
+                self._loaded_key = (json_file, st.st_mtime_ns, st.st_size)
+                
+                # Update display
+                self.display_results()
             
             # Update info label
-            file_time = datetime.fromtimestamp(os.path.getmtime(self.latest_json_file))
+            file_time = datetime.fromtimestamp(st.st_mtime)
             self.results_info_var.set(
                 f"File Details: {len(self.results_data)} items | "
                 f"File: {os.path.basename(self.latest_json_file)} | "
@@ -572,6 +701,7 @@ class ResultsDisplayManager:
             error_msg = f"Error loading results: {str(e)}"
             self.results_info_var.set("Error loading results")
             self.clear_results_table()
+            self._loaded_key = None
             self.download_button.config(state='disabled')
             
             if self.logger:
@@ -580,55 +710,72 @@ class ResultsDisplayManager:
                 messagebox.showerror("Error", error_msg)
     
     def display_results(self):
-        """Display results in the table"""
-        # Clear existing data
-        self.clear_results_table()
-        
-        if not self.results_data:
-            return
-        
-        # Populate table with file details
-        for item in self.results_data:
-            scrap_file_name = item.get('scrap_file_name', 'Unknown')
-            scrap_file_location = item.get('scrap_file_location', 'Unknown')
-            source_url = item.get('source_url', 'Unknown')
-            prompt_file_name = item.get('prompt_file_name', 'Unknown')
-            prompt_file_path = item.get('prompt_file_path', 'Unknown')
-            batch_number = item.get('batch_number', 'Unknown')
-            
+        """Display results in the table
+        
+        Rows matching the start of what the table already shows are kept; only
+        the differing tail is deleted and re-inserted, so a refresh after new
+        files were appended touches just the new rows.
+        """
+        self.cancel_population()
+        
+        # Length of the common prefix between the inserted rows and the new ones
+        shown_rows = self._shown_rows
+        keep = 0
+        limit = min(self._inserted_count, len(self.results_data))
+        while keep < limit and shown_rows[keep] == self.results_data[keep]:
+            keep += 1
+        
+        if keep < self._inserted_count:
+            self.results_tree.delete(*[str(index) for index in range(keep, self._inserted_count)])
+        self._shown_rows = self.results_data
+        self._inserted_count = keep
+        
+        if keep < len(self.results_data):
+            # Rows are already value tuples in column order
+            self.insert_result_rows(self.results_data, keep)
+    
+    def insert_result_rows(self, rows, start):
+        """Insert one chunk of rows, then yield to the event loop before the next
+        
+        Large result sets fill in progressively instead of freezing the UI until
+        every row is in the table.
+        """
+        end = min(start + TREE_INSERT_CHUNK, len(rows))
+        insert = self.results_tree.insert
+        for index in range(start, end):
             # Insert row with file details
-            self.results_tree.insert('', tk.END, values=(
-                scrap_file_name, scrap_file_location, source_url, 
-                prompt_file_name, prompt_file_path, batch_number
-            ))
+            insert('', tk.END, iid=str(index), values=rows[index])
+        self._inserted_count = end
+        
+        if end < len(rows):
+            self._populate_job = self.parent_frame.after(1, self.insert_result_rows, rows, end)
+        else:
+            self._populate_job = None
+    
+    def cancel_population(self):
+        """Stop a population still in progress from a previous load"""
+        if self._populate_job is not None:
+            self.parent_frame.after_cancel(self._populate_job)
+            self._populate_job = None
     
     def clear_results_table(self):
         """Clear all items from the results table"""
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        self.cancel_population()
+        self.results_tree.delete(*self.results_tree.get_children())
+        self._shown_rows = []
+        self._inserted_count = 0
     
     def download_csv(self):
         """Download results as CSV file"""
+        # Only needed for exports, so not loaded with the module
+        import csv
+        from tkinter import filedialog
+        
         try:
             if not self.results_data or not self.latest_json_file:
                 messagebox.showwarning("Warning", "No data to download")
                 return
             
-            # Create DataFrame from results data
-            df_data = []
-            for item in self.results_data:
-                row = {
-                    'Scrap File Name': item.get('scrap_file_name', 'Unknown'),
-                    'Scrap File Location': item.get('scrap_file_location', 'Unknown'),
-                    'Source URL': item.get('source_url', 'Unknown'),
-                    'Prompt File Name': item.get('prompt_file_name', 'Unknown'),
-                    'Prompt File Path': item.get('prompt_file_path', 'Unknown'),
-                    'Batch Number': item.get('batch_number', 'Unknown')
-                }
-                df_data.append(row)
-            
-            df = pd.DataFrame(df_data)
-            
             # Generate CSV filename based on JSON filename
             json_basename = os.path.splitext(os.path.basename(self.latest_json_file))[0]
             csv_filename = f"{json_basename}_file_details.csv"
@@ -642,13 +789,17 @@ class ResultsDisplayManager:
             )
             
             if file_path:
-                # Save CSV
-                df.to_csv(file_path, index=False, encoding='utf-8')
+                # Save CSV, streaming rows from results_data (os.linesep line
+                # endings, as pandas' to_csv wrote them)
+                with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f, lineterminator=os.linesep)
+                    writer.writerow(RESULT_COLUMNS)
+                    writer.writerows(self.results_data)
                 
                 messagebox.showinfo(
                     "Success", 
                     f"File details exported successfully to:\n{file_path}\n\n"
-                    f"Total records: {len(df_data)}"
+                    f"Total records: {len(self.results_data)}"
                 )
                 
                 if self.logger:
@@ -664,7 +815,7 @@ class ResultsDisplayManager:
     def on_scraping_complete(self):
         """Called when scraping is complete or cancelled"""
         # Automatically load the latest results
-        self.load_latest_results()
+        self.schedule_refresh()
     
     def get_frame_width(self):
         """Get the recommended width for the results frame"""
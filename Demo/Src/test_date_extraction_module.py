@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Tests for date_extraction_module
+Run with: python -m unittest test_date_extraction_module
+"""
+
+import random
+import re
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+from unittest import mock
+
+import date_extraction_module
+from date_extraction_module import DateExtractionPipeline, DateExtractorBase, DateMatch, FileSummary
+
+
+def reference_url(path):
+    """The original line-by-line URL scan over a file's first 11 lines"""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        for i, line in enumerate(f):
+            if i > 10:
+                break
+            url_match = re.search(r'https?://[^\s<>"\']+', line)
+            if url_match:
+                return url_match.group(0)
+    return None
+
+
+class FindDatesTest(unittest.TestCase):
+    """Dates are matched pattern by pattern and deduplicated in pattern priority order"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.extractor = DateExtractionPipeline()
+
+    def found(self, text):
+        return [match.date for match in self.extractor.find_dates(text, "Scrap_test.txt")]
+
+    def found_in_text(self, text):
+        return [match.date for match in self.extractor.find_dates_in_text(text, "Scrap_test.txt")]
+
+    def test_full_date_not_hidden_by_nearby_year(self):
+        # The bare year starts first, but MM/DD/YYYY has the higher priority
+        self.assertEqual(self.found("EOS: 2024 - 06/30/2025"), ["06/30/2025"])
+        self.assertEqual(self.found_in_text("EOS: 2024 - 06/30/2025"), ["06/30/2025"])
+
+    def test_year_inside_month_date_is_reported(self):
+        # The year starts 12 characters after the full date, outside the 10-character window
+        self.assertEqual(self.found("January 15, 2024"), ["January 15, 2024", "2024"])
+        self.assertEqual(self.found_in_text("January 15, 2024"), ["January 15, 2024", "2024"])
+
+    def test_pattern_used_is_recorded(self):
+        matches = self.extractor.find_dates_in_text("EOS: 2024 - 06/30/2025", "Scrap_test.txt")
+        self.assertEqual(matches[0].pattern_used, self.extractor.date_patterns[0])
+
+    def test_dedup_matches_linear_scan(self):
+        # Reference: the original any() scan over every accepted position
+        def reference(text):
+            clean_text = self.extractor.clean_text(text)
+            found, positions = [], set()
+            for pattern in self.extractor.date_patterns:
+                for match in re.finditer(pattern, clean_text, re.IGNORECASE):
+                    if any(abs(match.start() - pos) < 10 for pos in positions):
+                        continue
+                    positions.add(match.start())
+                    found.append((match.group(0), match.start(), pattern))
+            return found
+
+        tokens = ["2024", "06/30/2025", "2025-01-02", "Jan 5, 2026", "12 March 2027", "Q3 2025",
+                  "FY25", "mid 2026", "spring 2024", "end of June 2028", "x", "EOS:", "-", "support"]
+        rng = random.Random(0)
+        for _ in range(300):
+            text = " ".join(rng.choice(tokens) for _ in range(rng.randint(1, 40)))
+            found = [(m.date, m.position, m.pattern_used)
+                     for m in self.extractor.find_dates_in_text(text, "Scrap_test.txt")]
+            self.assertEqual(found, reference(text))
+
+
+class RecordItemAccessTest(unittest.TestCase):
+    """Match and summary records still answer the dict keys they replaced"""
+
+    def test_date_match_keys(self):
+        match = DateMatch("Scrap_test.txt", "2024", "in 2024", 3, "https://example.com", r"\b20\d{2}\b")
+        self.assertEqual(match["date"], "2024")
+        self.assertEqual(match["date_found"], "2024")
+        self.assertEqual(match["position"], 3)
+        self.assertEqual(match["pattern_used"], r"\b20\d{2}\b")
+        self.assertIsNone(match.get("missing"))
+        with self.assertRaises(KeyError):
+            match["missing"]
+        self.assertFalse(hasattr(match, "__dict__"))
+
+    def test_file_summary_keys(self):
+        summary = FileSummary("Scrap_test.txt", "/tmp/Scrap_test.txt", "Not available", 0, False)
+        self.assertEqual(summary["prompt_files"], [])
+        self.assertIsNone(summary["error"])
+        self.assertIsNot(summary.prompt_files,
+                         FileSummary("a", "b", "c", 0, False).prompt_files)
+
+
+class SplitIntoChunksTest(unittest.TestCase):
+    """Chunks keep every sentence in order and stay within the token budget"""
+
+    def setUp(self):
+        self.extractor = DateExtractionPipeline()
+
+    def use_tokenizer(self, count_tokens):
+        self.extractor.count_tokens = count_tokens
+        self.extractor.count_tokens_many = lambda texts: [count_tokens(t) for t in texts]
+
+    def check_chunks(self, text, max_chunk_tokens):
+        chunks = self.extractor.split_into_chunks(text, max_chunk_tokens)
+        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+        self.assertEqual(re.sub(r'[.!?]+', ' ', " ".join(chunks)).split(), " ".join(sentences).split())
+        for chunk in chunks:
+            # Only a single sentence may exceed the budget on its own
+            if chunk not in sentences:
+                self.assertLessEqual(self.extractor.count_tokens(chunk), max_chunk_tokens)
+        return chunks
+
+    def random_text(self, rng):
+        words = ["support", "ends", "2025", "model", "x", "lifecycle", "IBM", "service"]
+        return ". ".join(" ".join(rng.choice(words) for _ in range(rng.randint(1, 12)))
+                         for _ in range(rng.randint(2, 60))) + "."
+
+    def test_character_count_tokenizer(self):
+        self.use_tokenizer(lambda text: len(text) // 4)
+        rng = random.Random(1)
+        for _ in range(200):
+            self.check_chunks(self.random_text(rng), rng.randint(5, 80))
+
+    def test_superadditive_tokenizer(self):
+        # Joined sentences cost more than their summed counts, as BPE merges can
+        self.use_tokenizer(lambda text: len(text.split()) ** 2)
+        rng = random.Random(2)
+        for _ in range(200):
+            self.check_chunks(self.random_text(rng), rng.randint(20, 400))
+
+
+class FindScrapFilesTest(unittest.TestCase):
+    """find_scrap_files lists the same files as the Path.glob it replaced"""
+
+    def test_matches_glob(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            for name in ["Scrap_a.txt", "Scrap_b.txt", "scrap_c.txt", "Scrap_d.csv",
+                         "notes.txt", "Scrap_.txt"]:
+                (directory / name).write_text("URL: https://example.com\n", encoding="utf-8")
+            (directory / "Scrap_dir.txt").mkdir()
+
+            expected = sorted(p for p in directory.glob("Scrap_*.txt") if p.is_file())
+            self.assertEqual(sorted(DateExtractorBase.find_scrap_files(directory)), expected)
+
+    def test_unusable_directory_has_no_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            (directory / "Scrap_a.txt").write_text("", encoding="utf-8")
+            self.assertEqual(DateExtractorBase.find_scrap_files(directory / "missing"), [])
+            self.assertEqual(DateExtractorBase.find_scrap_files(directory / "Scrap_a.txt"), [])
+            with mock.patch("date_extraction_module.os.scandir", side_effect=PermissionError):
+                self.assertEqual(DateExtractorBase.find_scrap_files(directory), [])
+
+
+class WordIndexTest(unittest.TestCase):
+    """The array-based word offsets (Numba path) give the same contexts as the list path"""
+
+    def test_array_offsets_match_list_offsets(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy not installed")
+        extractor = DateExtractionPipeline()
+        tokens = ["2024", "Jan 5, 2026", "support", "ends", "x", "\u00e9t\u00e9", "\u2003", "\n", "  "]
+        rng = random.Random(3)
+        texts = [" ".join(rng.choice(tokens) for _ in range(rng.randint(1, 400))) for _ in range(50)]
+
+        def contexts():
+            found = []
+            for text in texts:
+                clean_text = extractor.clean_text(text)
+                words, offsets = extractor.build_word_index(clean_text)
+                found.append((list(offsets), [extractor.extract_context(clean_text, m.start(), m.end(), 5,
+                                                                        word_index=(words, offsets))
+                                              for _, m in extractor._scan_dates(clean_text)]))
+                found.append(extractor.extract_context(text, 7, 9, 5))
+            return found
+
+        with mock.patch.object(date_extraction_module, "_word_offsets_jit", False):
+            expected = contexts()
+        # Run the uncompiled kernel over arrays, as the Numba path does
+        kernel = (numpy, date_extraction_module._count_word_offsets)
+        with mock.patch.object(date_extraction_module, "_word_offsets_jit", kernel):
+            self.assertEqual(contexts(), expected)
+
+
+class ScrapFileUrlTest(unittest.TestCase):
+    """The URL is found anywhere in a file's first 11 lines, as the line-by-line scan did"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.extractor = DateExtractionPipeline()
+
+    def test_url_in_header_lines(self):
+        url = "https://www.ibm.com/support/pages/x"
+        headers = [
+            f"URL: {url}\nModel: x\n",
+            "Title: " + "t" * 10000 + f" {url}\nbody",
+            "\n" * 10 + url,
+            "\n" * 11 + url,
+            "no url here",
+            "",
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            for i, header in enumerate(headers):
+                path = Path(tmp) / f"Scrap_{i}.txt"
+                path.write_text(header + "\nEnd of support: 2025\n", encoding="utf-8")
+                expected = reference_url(path)
+                self.assertEqual(self.extractor.extract_url_from_file(path), expected)
+                self.assertEqual(self.extractor.read_scrap_file(path)[0], expected)
+
+
+class ReadScrapFileTest(unittest.TestCase):
+    """The memory-mapped read returns what the text-mode read did"""
+
+    def test_matches_text_mode_read(self):
+        extractor = DateExtractionPipeline()
+        contents = [
+            b"",
+            b"URL: https://example.com/a\nModel: x\n==========\nEnds 2025\n",
+            b"URL: https://example.com/b\r\nWindows lines\r\nEnds 2025\r\n",
+            b"old\rmac\rlines",
+            "URL: https://example.com/\u00e9t\u00e9\n\u00e9t\u00e9 2024 \u2014 fin\n".encode("utf-8"),
+            b"bad \xff\xfe bytes https://example.com/c\n2024\n",
+            b"no trailing newline 2024",
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            for i, content in enumerate(contents):
+                path = Path(tmp) / f"Scrap_{i}.txt"
+                path.write_bytes(content)
+                with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                    expected_text = f.read()
+                self.assertEqual(extractor.read_scrap_file(path), (reference_url(path), expected_text))
+
+
+class GroupIntoBatchesTest(unittest.TestCase):
+    """The prefix-sum batching matches the original match-by-match loop"""
+
+    def reference(self, extractor):
+        budget = extractor.max_tokens - 800
+        batches, current_batch, current_tokens = [], [], 0
+        for match in sorted(extractor.results, key=lambda x: x.filename):
+            match_tokens = extractor.count_tokens(match.context)
+            if current_tokens + match_tokens > budget:
+                if current_batch:
+                    batches.append(current_batch)
+                    current_batch = [match]
+                    current_tokens = match_tokens
+                else:
+                    for chunk in extractor.split_into_chunks(match.context, 1500):
+                        batches.append([replace(match, context=chunk)])
+            else:
+                current_batch.append(match)
+                current_tokens += match_tokens
+        if current_batch:
+            batches.append(current_batch)
+        return batches
+
+    def test_matches_reference_loop(self):
+        extractor = DateExtractionPipeline()
+        count_tokens = lambda text: len(text) // 4
+        extractor.count_tokens = count_tokens
+        extractor.count_tokens_many = lambda texts: [count_tokens(t) for t in texts]
+        rng = random.Random(4)
+        for _ in range(200):
+            extractor.max_tokens = rng.randint(850, 2000)
+            extractor.results = [
+                DateMatch(f"Scrap_{rng.randint(0, 5)}.txt", "2024",
+                          ". ".join("word " * rng.randint(1, 40) for _ in range(rng.randint(1, 60))),
+                          i, "Not available", None)
+                for i in range(rng.randint(0, 40))
+            ]
+            self.assertEqual(extractor.group_into_batches(), self.reference(extractor))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Tests for results_display_module
+Run with: python -m unittest test_results_display_module
+"""
+
+import json
+import os
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import results_display_module
+from results_display_module import ResultsDisplayManager, VIEWER_TRUNCATED_NOTE, read_viewer_chunks
+
+
+def reference_viewer_text(path):
+    """The original viewer read: UTF-8, or latin-1 when that fails"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except UnicodeDecodeError:
+        with open(path, 'r', encoding='latin-1') as f:
+            return f.read()
+
+
+class ReadViewerChunksTest(unittest.TestCase):
+    """The chunked viewer read shows what the UTF-8/latin-1 retry read did"""
+
+    def read(self, content, chunk_chars=7, max_chars=1 << 20):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "Scrap_test.txt"
+            path.write_bytes(content)
+            with mock.patch.object(results_display_module, "VIEWER_CHUNK_CHARS", chunk_chars), \
+                    mock.patch.object(results_display_module, "VIEWER_MAX_CHARS", max_chars):
+                return "".join(read_viewer_chunks(path)), reference_viewer_text(path)
+
+    def test_matches_reference_read(self):
+        contents = [
+            b"",
+            b"plain ascii\nline two\n",
+            "été — café \U0001f600\n".encode("utf-8"),
+            b"windows\r\nlines\r\nsplit\r\n\r\n",
+            b"old\rmac\rlines",
+            "café naïve \xff".encode("latin-1"),
+        ]
+        for content in contents:
+            shown, expected = self.read(content)
+            self.assertEqual(shown, expected)
+
+    def test_decoding_is_chosen_on_the_first_chunk(self):
+        # Valid UTF-8 up front keeps UTF-8; a later stray byte is replaced
+        shown, _ = self.read("été ok ".encode("utf-8") + b"x" * 20 + b"\xff")
+        self.assertEqual(shown, "été ok " + "x" * 20 + "�")
+
+    def test_large_file_is_truncated(self):
+        shown, expected = self.read(b"0123456789" * 10, chunk_chars=8, max_chars=30)
+        self.assertTrue(shown.endswith(VIEWER_TRUNCATED_NOTE))
+        self.assertTrue(expected.startswith(shown[:-len(VIEWER_TRUNCATED_NOTE)]))
+        self.assertEqual(len(shown) - len(VIEWER_TRUNCATED_NOTE), 32)
+
+
+class ReadLatestResultsTest(unittest.TestCase):
+    """The loader job decides from the key it is given, not from display state"""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        folder = Path("date_extraction_output_20250101_000000")
+        folder.mkdir()
+        summary = {"file_details": [{
+            "scrap_file_name": "Scrap_a.txt",
+            "scrap_file_path": "/tmp/Scrap_a.txt",
+            "url": "https://example.com",
+            "prompt_files": [{"prompt_file_name": "prompt_1.txt",
+                              "prompt_file_path": "/tmp/prompt_1.txt",
+                              "batch_number": 1}],
+        }]}
+        (folder / "comprehensive_summary_20250101_000000.json").write_text(json.dumps(summary))
+        # No widgets are needed to read results
+        self.manager = ResultsDisplayManager.__new__(ResultsDisplayManager)
+        self.manager.logger = None
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_unchanged_summary_is_not_reparsed(self):
+        status, json_file, st, raw_data, rows = self.manager.read_latest_results(None)
+        self.assertIsNone(status)
+        self.assertEqual(len(rows), 1)
+        self.assertIsNotNone(raw_data)
+
+        key = (json_file, st.st_mtime_ns, st.st_size)
+        self.assertEqual(self.manager.read_latest_results(key), (None, json_file, st, None, None))
+
+
+class FakeTree:
+    """The parts of ttk.Treeview the results table uses"""
+
+    def __init__(self):
+        self.rows = {}
+
+    def insert(self, parent, index, iid, values):
+        assert iid not in self.rows
+        self.rows[iid] = values
+
+    def delete(self, *iids):
+        for iid in iids:
+            del self.rows[iid]
+
+    def get_children(self):
+        return tuple(self.rows)
+
+
+class FakeFrame:
+    """Collects after() callbacks so a test decides when they run"""
+
+    def __init__(self):
+        self.jobs = {}
+        self.next_id = 0
+
+    def after(self, ms, func, *args):
+        self.next_id += 1
+        self.jobs[self.next_id] = (func, args)
+        return self.next_id
+
+    def after_cancel(self, job):
+        del self.jobs[job]
+
+    def run_one(self):
+        job = min(self.jobs)
+        func, args = self.jobs.pop(job)
+        func(*args)
+
+
+class DisplayResultsTest(unittest.TestCase):
+    """The incremental table update ends with the same rows as a full rebuild"""
+
+    def test_matches_full_rebuild(self):
+        manager = ResultsDisplayManager.__new__(ResultsDisplayManager)
+        manager.results_tree = FakeTree()
+        manager.parent_frame = FakeFrame()
+        manager._populate_job = None
+        manager._shown_rows = []
+        manager._inserted_count = 0
+
+        rng = random.Random(5)
+        rows = [("Scrap_%d.txt" % i, "/tmp", "https://example.com", "p.txt", "/tmp/p.txt", 1)
+                for i in range(30)]
+        with mock.patch.object(results_display_module, "TREE_INSERT_CHUNK", 4):
+            for _ in range(300):
+                # Appended, truncated or edited row lists, sometimes loaded mid-population
+                manager.results_data = rows[:rng.randint(0, 30)]
+                if manager.results_data and rng.random() < 0.3:
+                    i = rng.randrange(len(manager.results_data))
+                    manager.results_data[i] = manager.results_data[i][:5] + (2,)
+                manager.display_results()
+                for _ in range(rng.randint(0, 10)):
+                    if manager.parent_frame.jobs:
+                        manager.parent_frame.run_one()
+                if rng.random() < 0.3:
+                    self.check_table(manager)
+            self.check_table(manager)
+
+    def check_table(self, manager):
+        while manager.parent_frame.jobs:
+            manager.parent_frame.run_one()
+        expected = {str(i): row for i, row in enumerate(manager.results_data)}
+        self.assertEqual(manager.results_tree.rows, expected)
+        self.assertEqual(manager.results_tree.get_children(), tuple(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
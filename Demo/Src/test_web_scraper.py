@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Tests for web_scraper
+Run with: python -m unittest test_web_scraper
+"""
+
+import itertools
+import logging
+import os
+import queue
+import socket
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import mock
+
+import requests
+
+from web_scraper import KeepAliveHTTPAdapter, WebScraperApp
+
+
+class ScraperTestCase(unittest.TestCase):
+    """Runs an app without its window in a scratch directory"""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        # No window is needed to scrape a page
+        self.app = WebScraperApp.__new__(WebScraperApp)
+        self.app.logger = logging.getLogger("test_web_scraper")
+        self.app._log_queue = queue.Queue()
+        self.app._page_text_cache = {}
+        self.app._run_stamp = "20250101_000000"
+        self.app._file_counter = itertools.count(1)
+        self.app._host_next_ok = {}
+        self.app._host_slot_lock = threading.Lock()
+        self.app.cancel_event = threading.Event()
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+
+class ScrapeWebsiteTest(ScraperTestCase):
+    """A page counts as relevant when its parsed text mentions the model"""
+
+    def scrape(self, page, model="IBM 9117-MMA"):
+        self.app.fetch_page = lambda url: page
+        self.app._page_text_cache.clear()
+        return self.app.scrape_website("https://example.com/?q=model", model, "example.com")
+
+    def assertRelevant(self, page, model="IBM 9117-MMA"):
+        info, filename = self.scrape(page, model)
+        self.assertIsNotNone(filename, page)
+        self.assertTrue(os.path.exists(filename))
+
+    def test_character_references(self):
+        self.assertRelevant(b"<p>IBM&#32;9117&#8209;MMA</p>")
+        self.assertRelevant(b"<p>&#73;BM&nbsp;9117-&#x4d;MA</p>")
+        self.assertRelevant(b"<p>IBM 9117&lowbar;MMA</p>", model="IBM 9117_MMA")
+
+    def test_declared_and_detected_charsets(self):
+        # Dotted capital I (windows-1254 0xDD) lowercases to an i
+        self.assertRelevant(b'<meta charset="windows-1254"><p>\xddBM 9117-MMA</p>')
+        # Kelvin sign lowercases to k
+        self.assertRelevant('<meta charset="utf-8"><p>\u212a9117 rack</p>'.encode("utf-8"),
+                            model="k9117")
+        self.assertRelevant('<p>IBM 9117-MMA</p>'.encode("utf-16"))
+        self.assertRelevant('<p>サーバー IBM 9117-MMA</p>'.encode("shift_jis"))
+
+    def test_comments_and_tags_inside_the_model(self):
+        self.assertRelevant(b"<p>IBM<!-- model -->9117-MMA</p>")
+        self.assertRelevant(b"<p><b>IBM</b> 9117-<i>MMA</i></p>")
+        self.assertRelevant(b'<p><a title="a>b">IBM</a> 9117-MMA</p>')
+        self.assertRelevant(b"<!--><p>IBM 9117-MMA</p><!-- -->")
+
+    def test_stripped_elements_and_missing_model(self):
+        self.assertEqual(self.scrape(b"<script>IBM 9117-MMA</script><p>other</p>"), (None, None))
+        self.assertEqual(self.scrape(b"<p>IBM 9009-42A</p>"), (None, None))
+
+
+class EvictingCache(dict):
+    """A page cache that another worker clears right after each lookup"""
+
+    def get(self, key, default=None):
+        value = super().get(key, default)
+        self.clear()
+        return value
+
+    def __contains__(self, key):
+        found = super().__contains__(key)
+        self.clear()
+        return found
+
+
+class ThrottledScrapeTest(ScraperTestCase):
+    """Every page request is made in a reserved slot of its host"""
+
+    def fetch(self, url):
+        self.assertIn("example.com", self.app._host_next_ok)
+        self.fetched += 1
+        return b"<p>IBM 9117-MMA</p>"
+
+    def test_cached_page_needs_no_slot(self):
+        self.fetched = 0
+        self.app.fetch_page = self.fetch
+        url = "https://example.com/?q=model"
+        for _ in range(2):
+            info, filename = self.app.throttled_scrape(url, "IBM 9117-MMA", 0, "")
+            self.assertIsNotNone(filename)
+        self.assertEqual(self.fetched, 1)
+
+    def test_page_evicted_after_the_check_is_not_fetched_without_a_slot(self):
+        self.fetched = 0
+        self.app.fetch_page = self.fetch
+        url = "https://example.com/?q=model"
+        self.app._page_text_cache = EvictingCache({url: "IBM 9117-MMA"})
+        info, filename = self.app.throttled_scrape(url, "IBM 9117-MMA", 0, "")
+        self.assertIsNotNone(filename)
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    """Answers every request with a short page, closing the connection after it"""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CachedDNSTest(unittest.TestCase):
+    """The adapter resolves hosts through its own cache, trying each cached address"""
+
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), OkHandler)
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True).start()
+        self.session = requests.Session()
+        self.session.mount("http://", KeepAliveHTTPAdapter())
+        self.lookups = []
+        self.addresses = ["127.0.0.1"]
+        self._getaddrinfo = socket.getaddrinfo
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def getaddrinfo(self, host, *args, **kwargs):
+        if host != "scraper.test":
+            return self._getaddrinfo(host, *args, **kwargs)
+        self.lookups.append(host)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, 0))
+                for address in self.addresses]
+
+    def get(self):
+        with mock.patch("socket.getaddrinfo", self.getaddrinfo):
+            return self.session.get(f"http://scraper.test:{self.port}/", timeout=5)
+
+    def test_lookups_are_cached(self):
+        for _ in range(3):
+            self.assertEqual(self.get().text, "ok")
+        self.assertEqual(self.lookups, ["scraper.test"])
+
+    def test_unreachable_address_fails_over_to_the_next(self):
+        # Nothing listens on 127.0.0.2, so that connection is refused
+        self.addresses = ["127.0.0.2", "127.0.0.1"]
+        self.assertEqual(self.get().text, "ok")
+
+    def test_host_is_resolved_again_when_no_address_answers(self):
+        self.addresses = ["127.0.0.2"]
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.get()
+        self.addresses = ["127.0.0.1"]
+        self.assertEqual(self.get().text, "ok")
+        self.assertEqual(len(self.lookups), 2)
+
+    def test_resolver_belongs_to_the_adapter(self):
+        getaddrinfo = socket.getaddrinfo
+        app = WebScraperApp.__new__(WebScraperApp)
+        app.headers = {}
+        app.setup_session()
+        self.assertIs(socket.getaddrinfo, getaddrinfo)
+        self.assertIs(app.session.get_adapter("http://a").resolver,
+                      app.session.get_adapter("https://a").resolver)
+        self.assertIsNot(app.session.get_adapter("http://a").resolver,
+                         KeepAliveHTTPAdapter().resolver)
+
+
+if __name__ == "__main__":
+    unittest.main()
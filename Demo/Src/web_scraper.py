@@ -2,20 +2,194 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import datetime
+import itertools
+import functools
 import os
 import re
+import sys
+import socket
 import logging
 from urllib.parse import urljoin, urlparse
 import json
 import urllib3
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
 from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 from results_display_module import ResultsDisplayManager
 
+# Parse pages with BeautifulSoup's lxml (C) backend when lxml is installed
+try:
+    import lxml
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Use orjson for writing the summary file when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Models searched at once, pages fetched at once across them, and the pause
+# each host gets after a request
+MODEL_WORKERS = 16
+FETCH_WORKERS = 32
+SEARCH_DELAY = 3
+IBM_DELAY = 2
+
+# Only the start of a page is downloaded; saved text is cut to 5000 chars anyway
+MAX_PAGE_BYTES = 512 * 1024
+PAGE_CHUNK_BYTES = 64 * 1024
+
+# Cleaned page texts kept per run, for input lists that repeat a model
+PAGE_CACHE_SIZE = 256
+
+# Page elements whose text is dropped before extraction
+_STRIP_TAGS = frozenset(("script", "style", "nav", "footer", "aside"))
+
+# Text cleanup and end-of-sales/life/service date patterns, compiled once
+_WS_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r'[^\w\s\-\./:]')
+_NON_WORD_RE = re.compile(r'[^\w]')
+_EOL_DATE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'end.{0,10}of.{0,10}sales?.{0,20}(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'end.{0,10}of.{0,10}life.{0,20}(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'end.{0,10}of.{0,10}service.{0,20}(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'sales?.{0,10}end.{0,20}(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'life.{0,10}end.{0,20}(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'service.{0,10}end.{0,20}(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
+))
+
+# Resolved addresses are reused for a while, so the repeated requests to the
+# same few search and vendor hosts skip the resolver
+DNS_CACHE_TTL = 300
+DNS_CACHE_SIZE = 256
+
+class CachingResolver:
+    """Addresses of the hosts a session connects to, kept for DNS_CACHE_TTL seconds"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()  # Guards _entries
+        self._entries = {}  # (host, family) -> (addresses, expiry)
+    
+    def addresses(self, host, family):
+        """The addresses of host, resolved again once the cached ones expire"""
+        key = (host, family)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        
+        # Resolve outside the lock, so a slow lookup doesn't hold up other hosts
+        infos = socket.getaddrinfo(host, None, family, socket.SOCK_STREAM)
+        addresses = tuple(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            if len(self._entries) >= DNS_CACHE_SIZE:
+                self._entries.clear()
+            self._entries[key] = (addresses, now + DNS_CACHE_TTL)
+        return addresses
+    
+    def forget(self, host, family):
+        """Drop the cached addresses of host, e.g. when none of them answered"""
+        with self._lock:
+            self._entries.pop((host, family), None)
+
+class _CachedDNSConnectionMixin:
+    """Opens the socket to each cached address of the host in turn"""
+    resolver = None  # Set by the pool that creates the connection
+    
+    def _new_conn(self):
+        host = self._dns_host
+        if self.resolver is None:
+            return super()._new_conn()
+        
+        family = allowed_gai_family()
+        try:
+            addresses = self.resolver.addresses(host, family)
+        except OSError:
+            addresses = ()
+        if not addresses:
+            # Let urllib3 look the host up and report the failure as usual
+            return super()._new_conn()
+        
+        # urllib3 connects to _dns_host; host, used for SNI and the Host
+        # header, is read from it only after the socket is open
+        try:
+            for address in addresses:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError) as e:
+                    error = e
+        finally:
+            self._dns_host = host
+        
+        # None of the addresses answered; they may have moved, so resolve again next time
+        self.resolver.forget(host, family)
+        raise error
+
+class CachedDNSHTTPConnection(_CachedDNSConnectionMixin, HTTPConnection):
+    pass
+
+class CachedDNSHTTPSConnection(_CachedDNSConnectionMixin, HTTPSConnection):
+    pass
+
+class _CachedDNSPoolMixin:
+    """Hands the session's resolver to every connection the pool opens"""
+    
+    def __init__(self, *args, resolver=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.resolver = resolver
+    
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.resolver = self.resolver
+        return conn
+
+class CachedDNSHTTPConnectionPool(_CachedDNSPoolMixin, HTTPConnectionPool):
+    ConnectionCls = CachedDNSHTTPConnection
+
+class CachedDNSHTTPSConnectionPool(_CachedDNSPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = CachedDNSHTTPSConnection
+
+# Pooled sockets keep urllib3's TCP_NODELAY and add keepalive probes, so
+# connections idle between searches aren't dropped by middleboxes
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, 'TCP_KEEPIDLE'):
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+if hasattr(socket, 'TCP_KEEPINTVL'):
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 15))
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections are opened with _SOCKET_OPTIONS,
+    to the addresses its own CachingResolver keeps for each host"""
+    
+    def __init__(self, *args, **kwargs):
+        self.resolver = CachingResolver()
+        super().__init__(*args, **kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': functools.partial(CachedDNSHTTPConnectionPool, resolver=self.resolver),
+            'https': functools.partial(CachedDNSHTTPSConnectionPool, resolver=self.resolver),
+        }
+
 class WebScraperApp:
     def __init__(self, root):
         self.root = root
@@ -29,6 +203,14 @@ class WebScraperApp:
         self.scraping_active = False
         self.scraping_thread = None
         self.cancel_event = threading.Event()
+        self._model_pool = None  # Searches the models of the current run, see scrape_data
+        self._fetch_pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS)  # Fetches a model's pages concurrently
+        self._host_next_ok = {}  # host -> monotonic time its next request may start
+        self._host_slot_lock = threading.Lock()  # Guards _host_next_ok
+        self._run_stamp = None  # Scrap file names: run start time plus a per-run counter
+        self._file_counter = itertools.count()
+        self._page_text_cache = {}  # url -> cleaned page text
+        self._log_queue = queue.Queue()  # Progress lines waiting for the next drain
         
         # Disable SSL warnings
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -38,13 +220,15 @@ class WebScraperApp:
         
         # Create GUI
         self.create_gui()
+        self.root.after(100, self._drain_log_queue)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         # Headers for web requests - MOVED BEFORE setup_session()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': ACCEPT_ENCODING,  # gzip/deflate, plus br when brotli is installed
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
@@ -119,7 +303,15 @@ class WebScraperApp:
             status_forcelist=[429, 500, 502, 503, 504],
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the connection pools for the concurrent fetches, so every worker
+        # reuses a kept-alive socket instead of opening and discarding extras
+        adapter = KeepAliveHTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=FETCH_WORKERS,
+            max_retries=retry_strategy,
+            pool_block=False,
+        )
+        # One adapter for both schemes, so they share its DNS cache
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -256,6 +448,9 @@ class WebScraperApp:
         if messagebox.askyesno("Confirm", "Starting the scraping for input data. Continue?"):
             self.scraping_active = True
             self.cancel_event.clear()
+            self._run_stamp = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            self._file_counter = itertools.count()
+            self._page_text_cache.clear()
             self.start_button.config(state='disabled')
             self.cancel_button.config(state='normal')
             self.progress_text.delete(1.0, tk.END)
@@ -271,28 +466,55 @@ class WebScraperApp:
             self.update_progress("The Scraping will be Stopped")
             self.logger.info("Scraping cancellation requested")
     
+    def on_closing(self):
+        """Stop any running scrape and close the window
+        
+        Pool worker threads are not daemons, so without dropping the queued
+        models and page fetches they would all run before the process exits.
+        """
+        self.cancel_event.set()
+        for pool in (self._model_pool, self._fetch_pool):
+            if pool is None:
+                continue
+            if sys.version_info >= (3, 9):
+                pool.shutdown(wait=False, cancel_futures=True)
+            else:
+                # Queued items still run, but return at once with cancel_event set
+                pool.shutdown(wait=False)
+        self.root.destroy()
+    
     def update_progress(self, message):
-        """Update progress text in thread-safe manner"""
-        def update():
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            self.progress_text.insert(tk.END, f"[{timestamp}] {message}\n")
-            self.progress_text.see(tk.END)
-            self.root.update_idletasks()
+        """Queue message for the progress area (safe to call from worker threads)"""
+        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        self._log_queue.put(f"[{timestamp}] {message}\n")
+    
+    def _drain_log_queue(self):
+        """Write all queued progress lines with a single insert, then reschedule"""
+        batch = []
+        try:
+            while True:
+                batch.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
         
-        self.root.after(0, update)
+        if batch:
+            self.progress_text.insert(tk.END, "".join(batch))
+            self.progress_text.see(tk.END)
+        self.root.after(100, self._drain_log_queue)
     
-    def clean_text(self, text):
-        """Remove HTML tags and clean text"""
+    def clean_text(self, text, already_text=False):
+        """Remove HTML tags and clean text (already_text skips the tag removal)"""
         if not text:
             return ""
         
-        # Remove HTML tags
-        soup = BeautifulSoup(text, 'html.parser')
-        text = soup.get_text()
+        # Remove HTML tags (text without tags or entities has nothing to parse)
+        if not already_text and ('<' in text or '&' in text):
+            soup = BeautifulSoup(text, HTML_PARSER)
+            text = soup.get_text()
         
         # Remove extra whitespace and special characters
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^\w\s\-\./:]', ' ', text)
+        text = _WS_RE.sub(' ', text)
+        text = _PUNCT_RE.sub(' ', text)
         
         return text.strip()
     
@@ -317,17 +539,8 @@ class WebScraperApp:
             info['vendor_name'] = 'HP/HPE'
         
         # Look for date patterns
-        date_patterns = [
-            r'end.{0,10}of.{0,10}sales?.{0,20}(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'end.{0,10}of.{0,10}life.{0,20}(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'end.{0,10}of.{0,10}service.{0,20}(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'sales?.{0,10}end.{0,20}(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'life.{0,10}end.{0,20}(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'service.{0,10}end.{0,20}(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.finditer(pattern, text_lower)
+        for pattern in _EOL_DATE_PATTERNS:
+            matches = pattern.finditer(text_lower)
             for match in matches:
                 date_str = match.group(1)
                 if 'sales' in match.group(0):
@@ -339,29 +552,20 @@ class WebScraperApp:
         
         return info
     
-    def scrape_website(self, url, model):
-        """Scrape a single website"""
+    def scrape_website(self, url, model, host, cleaned_text=None):
+        """Scrape a single website on host (cleaned_text: its page text, if already fetched)"""
         try:
-            self.update_progress(f"Connecting to {urlparse(url).netloc}...")
+            model_clean = _NON_WORD_RE.sub('', model.lower())
             
-            # Make request with session
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            # Parse the content
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "footer", "aside"]):
-                script.decompose()
-            
-            # Get text content
-            text_content = soup.get_text()
-            cleaned_text = self.clean_text(text_content)
+            if cleaned_text is None:
+                self.update_progress(f"Connecting to {host}...")
+                cleaned_text = self.fetch_page_text(url)
+                if len(self._page_text_cache) >= PAGE_CACHE_SIZE:
+                    self._page_text_cache.clear()
+                self._page_text_cache[url] = cleaned_text
             
             # Check if the content is relevant (contains model number)
-            model_clean = re.sub(r'[^\w]', '', model.lower())
-            content_clean = re.sub(r'[^\w]', '', cleaned_text.lower())
+            content_clean = _NON_WORD_RE.sub('', cleaned_text.lower())
             
             if model_clean not in content_clean:
                 self.logger.info(f"Model {model} not found in content from {url}")
@@ -371,96 +575,139 @@ class WebScraperApp:
             info = self.extract_relevant_info(cleaned_text, model)
             
             # Create output file
-            timestamp = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")[:17]  # Include microseconds
-            domain = urlparse(url).netloc.replace('www.', '').replace('.', '_')
-            filename = f"Scrap_{domain}_{timestamp}.txt"
-            
+            # Unique even for pages saved at the same moment by concurrent fetches
+            domain = host.replace('www.', '').replace('.', '_')
+            filename = f"Scrap_{domain}_{self._run_stamp}_{next(self._file_counter)}.txt"
+            
+            # Build the whole file first and write it in one call
+            payload = (f"URL: {url}\n"
+                       f"Model: {model}\n"
+                       f"Scraped at: {datetime.datetime.utcnow().isoformat()}\n"
+                       f"{'=' * 50}\n"
+                       f"{cleaned_text[:5000]}")  # Limit content size
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"URL: {url}\n")
-                f.write(f"Model: {model}\n")
-                f.write(f"Scraped at: {datetime.datetime.utcnow().isoformat()}\n")
-                f.write("="*50 + "\n")
-                f.write(cleaned_text[:5000])  # Limit content size
+                f.write(payload)
             
             self.update_progress(f"Successfully scraped {domain} - saved to {filename}")
             return info, filename
             
         except requests.exceptions.SSLError as e:
             self.logger.error(f"SSL Error scraping {url}: {str(e)}")
-            self.update_progress(f"SSL Error with {urlparse(url).netloc} - skipping")
+            self.update_progress(f"SSL Error with {host} - skipping")
             return None, None
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Request Error scraping {url}: {str(e)}")
-            self.update_progress(f"Connection error with {urlparse(url).netloc} - skipping")
+            self.update_progress(f"Connection error with {host} - skipping")
             return None, None
         except Exception as e:
             self.logger.error(f"Error scraping {url}: {str(e)}")
-            self.update_progress(f"Error with {urlparse(url).netloc}: {str(e)[:50]}")
+            self.update_progress(f"Error with {host}: {str(e)[:50]}")
             return None, None
     
+    def fetch_page_text(self, url):
+        """Download and clean the text of url"""
+        # Make request with session
+        content = self.fetch_page(url)
+        
+        # Parse the content
+        soup = BeautifulSoup(content, HTML_PARSER)
+        
+        # Remove script and style elements, found in one plain walk of the tree
+        # (find_all with a list of names runs bs4's generic matcher per element)
+        for element in [node for node in soup.descendants
+                        if isinstance(node, Tag) and node.name in _STRIP_TAGS]:
+            element.decompose()
+        
+        # Get text content
+        text_content = soup.get_text()
+        # get_text() has already removed the markup, so don't parse it again
+        return self.clean_text(text_content, already_text=True)
+    
+    def fetch_page(self, url):
+        """Download url, keeping at most MAX_PAGE_BYTES of the (decoded) body"""
+        with self.session.get(url, timeout=15, stream=True) as response:
+            response.raise_for_status()
+            
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(PAGE_CHUNK_BYTES):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= MAX_PAGE_BYTES:
+                    break
+        
+        return b''.join(chunks)
+    
     def search_model_info(self, model):
         """Search for model information across multiple sites"""
         results = []
         
-        # First try direct IBM support search
-        self.try_ibm_direct_search(model, results)
-        
-        if self.cancel_event.is_set():
-            return results
+        # First queue the direct IBM support search, then the alternative search
+        # engines; all pages are fetched concurrently, with requests to a host spaced out
+        pages = self.try_ibm_direct_search(model)
         
-        # Then try alternative search engines
         for base_url in self.search_sites:
-            if self.cancel_event.is_set():
-                break
-                
+            search_query = f"{model} end of life support date"
+            search_url = base_url + search_query.replace(' ', '+')
+            
+            website_name = urlparse(base_url).netloc or "search_engine"
+            future = self._fetch_pool.submit(self.throttled_scrape, search_url, model, SEARCH_DELAY,
+                                             f"Searching {website_name} for {model}")
+            pages.append((search_url, future))
+        
+        # Collect in submission order so results keep the sequential ordering
+        for url, future in pages:
             try:
-                search_query = f"{model} end of life support date"
-                search_url = base_url + search_query.replace(' ', '+')
-                
-                website_name = urlparse(base_url).netloc or "search_engine"
-                self.update_progress(f"Searching {website_name} for {model}")
-                
-                info, filename = self.scrape_website(search_url, model)
+                info, filename = future.result()
                 
                 if info and filename:
-                    info['url'] = search_url
+                    info['url'] = url
                     info['filename'] = filename
                     results.append(info)
-                    
-                # Add delay between requests
-                time.sleep(3)
                 
             except Exception as e:
-                self.logger.error(f"Error searching for {model} on {base_url}: {str(e)}")
+                self.logger.error(f"Error searching for {model} on {url}: {str(e)}")
                 continue
         
         return results
     
-    def try_ibm_direct_search(self, model, results):
-        """Try to search IBM support directly"""
-        try:
-            # Create a simple IBM support URL
-            ibm_urls = [
-                f"https://www.ibm.com/support/pages/search?q={model}",
-                f"https://www.ibm.com/docs/search?q={model}",
-            ]
-            
-            for url in ibm_urls:
-                if self.cancel_event.is_set():
-                    break
-                    
-                self.update_progress(f"Checking IBM support for {model}")
-                info, filename = self.scrape_website(url, model)
-                
-                if info and filename:
-                    info['url'] = url
-                    info['filename'] = filename
-                    results.append(info)
-                
-                time.sleep(2)
-                
-        except Exception as e:
-            self.logger.error(f"Error in IBM direct search for {model}: {str(e)}")
+    def try_ibm_direct_search(self, model):
+        """Queue searches of IBM support directly, returning (url, future) pairs"""
+        # Create a simple IBM support URL
+        ibm_urls = [
+            f"https://www.ibm.com/support/pages/search?q={model}",
+            f"https://www.ibm.com/docs/search?q={model}",
+        ]
+        
+        return [(url, self._fetch_pool.submit(self.throttled_scrape, url, model, IBM_DELAY,
+                                              f"Checking IBM support for {model}"))
+                for url in ibm_urls]
+    
+    def throttled_scrape(self, url, model, delay, message):
+        """Scrape url in its host's next free slot; the host's following slot opens delay seconds later"""
+        host = urlparse(url).netloc
+        
+        # Pages already fetched in this run (repeated input models) are reused;
+        # every URL embeds its model, so a cached page always fits this model.
+        # The cache is read once: a page it doesn't give is fetched, which
+        # always takes a slot, even if another worker caches the page meanwhile
+        cleaned_text = self._page_text_cache.get(url)
+        
+        # Reserve a slot, then wait only for whatever is left until it opens
+        wait = 0
+        if cleaned_text is None:
+            with self._host_slot_lock:
+                now = time.monotonic()
+                start = max(now, self._host_next_ok.get(host, 0))
+                self._host_next_ok[host] = start + delay
+            wait = start - now
+        
+        # Delay between requests to the same host (cut short on cancel)
+        if self.cancel_event.wait(wait):
+            return None, None
+        
+        self.update_progress(message)
+        return self.scrape_website(url, model, host, cleaned_text)
     
     def create_mock_data_for_testing(self, model):
         """Create mock data when scraping fails (for testing purposes)"""
@@ -480,32 +727,40 @@ class WebScraperApp:
             self.status_var.set("Scraping in progress...")
             
             all_results = []
-            
-            for i, model in enumerate(self.data):
-                if self.cancel_event.is_set():
-                    self.update_progress("Scraping cancelled by user")
-                    break
-                
-                self.update_progress(f"Processing {model} ({i+1}/{len(self.data)})")
-                self.logger.info(f"Processing model: {model}")
-                
-                # Search for model information
-                model_results = self.search_model_info(model)
+            total = len(self.data)
+            model_results = [None] * total  # Kept in input order, whatever order models finish in
+            
+            # Search the models concurrently; throttled_scrape still spaces out the
+            # requests to each site
+            with ThreadPoolExecutor(max_workers=MODEL_WORKERS) as executor:
+                self._model_pool = executor
+                futures = {executor.submit(self.process_model, i, model): i
+                           for i, model in enumerate(self.data)}
                 
-                # If no results found, create a placeholder entry
-                if not model_results:
-                    self.update_progress(f"No data found for {model} - creating placeholder entry")
-                    mock_result = self.create_mock_data_for_testing(model)
-                    mock_result['model'] = model
-                    all_results.append(mock_result)
-                else:
-                    for result in model_results:
-                        result['model'] = model
-                        all_results.append(result)
-                
-                # Update progress
-                progress_percent = ((i + 1) / len(self.data)) * 100
-                self.status_var.set(f"Progress: {progress_percent:.1f}% - Processing {model}")
+                completed = 0
+                cancel_reported = False
+                for future in as_completed(futures):
+                    if self.cancel_event.is_set() and not cancel_reported:
+                        cancel_reported = True
+                        self.update_progress("Scraping cancelled by user")
+                        # Drop the models that haven't started yet
+                        for pending in futures:
+                            pending.cancel()
+                    if future.cancelled():
+                        continue
+                    
+                    i = futures[future]
+                    model_results[i] = future.result()
+                    
+                    # Update progress
+                    completed += 1
+                    progress_percent = (completed / total) * 100
+                    self.root.after(0, self.status_var.set,
+                                    f"Progress: {progress_percent:.1f}% - Processed {self.data[i]}")
+            
+            for results in model_results:
+                if results:
+                    all_results.extend(results)
             
             # Save summary results
             if all_results:
@@ -532,14 +787,40 @@ class WebScraperApp:
             # Load and display results after scraping completes or is cancelled
             self.root.after(1000, self.results_display.on_scraping_complete)
     
+    def process_model(self, i, model):
+        """Search one model, returning its result entries (None if cancelled first)"""
+        if self.cancel_event.is_set():
+            return None
+        
+        self.update_progress(f"Processing {model} ({i+1}/{len(self.data)})")
+        self.logger.info(f"Processing model: {model}")
+        
+        # Search for model information
+        model_results = self.search_model_info(model)
+        
+        # If no results found, create a placeholder entry
+        if not model_results:
+            self.update_progress(f"No data found for {model} - creating placeholder entry")
+            mock_result = self.create_mock_data_for_testing(model)
+            mock_result['model'] = model
+            return [mock_result]
+        
+        for result in model_results:
+            result['model'] = model
+        return model_results
+    
     def save_summary_results(self, results):
         """Save summary of all results"""
         timestamp = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         summary_filename = f"Scraping_Summary_{timestamp}.json"
         
         try:
-            with open(summary_filename, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                with open(summary_filename, 'wb') as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(summary_filename, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, indent=2, ensure_ascii=False)
             
             self.update_progress(f"Summary saved to {summary_filename}")
             self.logger.info(f"Summary saved to {summary_filename}")